@@ -40,7 +40,10 @@ PLAYER_ANIMATION_SPEED = 250  # ms/frame
 PLAYER_BULLET_WIDTH = 16
 PLAYER_BULLET_HEIGHT = 12
 PLAYER_BULLET_VELOCITY_X = 8
+PLAYER_BULLET_SPAWN_OFFSET_Y = TILE_SIZE // 2  # Hauteur du canon, entière comme les coordonnées des Rect
 PLAYER_SHOOT_COOLDOWN = 250  # ms
+# Tirs simultanés au plus: durée de traversée de l'écran / cooldown
+PLAYER_MAX_BULLETS = GAME_WIDTH * 1000 // (PLAYER_BULLET_VELOCITY_X * FPS * PLAYER_SHOOT_COOLDOWN) + 1
 
 # Ennemis
 METALL_WIDTH = 36
@@ -11,8 +11,16 @@ from config import *
 class Enemy(pygame.Rect):
     """
     Classe de base pour tous les ennemis.
+    
+    Les ennemis déclarent leurs attributs via __slots__: pas de __dict__
+    par instance, donc des objets plus compacts et un accès plus direct.
     """
     
+    __slots__ = ("health", "direction", "velocity_y", "jumping")
+    
+    # Projectiles de l'ennemi: aucun par défaut (les tireurs déclarent leur propre liste)
+    bullets = ()
+    
     def __init__(self, x, y, width, height, health):
         super().__init__(x, y, width, height)
         self.health = health
@@ -20,13 +28,17 @@ class Enemy(pygame.Rect):
         self.velocity_y = 0
         self.jumping = False
     
-    def update(self):
+    def update(self, player_x, now, camera_x=0):
         """Met à jour l'ennemi - à surcharger"""
         raise NotImplementedError
     
-    def draw(self, screen):
-        """Dessine l'ennemi - à surcharger"""
+    def draw(self, screen, camera_x=0):
+        """Dessine l'ennemi (décalé de camera_x) - à surcharger"""
         raise NotImplementedError
+    
+    def is_visible(self, camera_x=0):
+        """Indique si l'ennemi chevauche horizontalement l'écran qui commence en camera_x"""
+        return self.x < camera_x + GAME_WIDTH and self.x + self.width > camera_x
 
 
 class Metall(Enemy):
@@ -37,6 +49,8 @@ class Metall(Enemy):
     class Bullet(pygame.Rect):
         """Projectile de Metall"""
         
+        __slots__ = ("velocity_x", "velocity_y", "image", "used")
+        
         def __init__(self, x, y, velocity_x, velocity_y, image):
             super().__init__(x, y, METALL_BULLET_WIDTH, METALL_BULLET_HEIGHT)
             self.velocity_x = velocity_x
@@ -44,80 +58,116 @@ class Metall(Enemy):
             self.image = image
             self.used = False
         
+        def reset(self, x, y, velocity_x, velocity_y):
+            """Réinitialise un projectile recyclé depuis le pool"""
+            self.x = x
+            self.y = y
+            self.velocity_x = velocity_x
+            self.velocity_y = velocity_y
+            self.used = False
+        
         def update(self):
             self.x += self.velocity_x
             self.y += self.velocity_y
     
+    __slots__ = ("images", "guarding", "bullets", "last_fired", "_image", "_bullet_pool")
+    
+    # Vitesses (x, y) des 3 projectiles (haut, milieu, bas) selon la direction
+    SPREAD = {
+        "left": ((-METALL_BULLET_VELOCITY_X, -METALL_BULLET_VELOCITY_Y),
+                 (-METALL_BULLET_VELOCITY_X, 0),
+                 (-METALL_BULLET_VELOCITY_X, METALL_BULLET_VELOCITY_Y)),
+        "right": ((METALL_BULLET_VELOCITY_X, -METALL_BULLET_VELOCITY_Y),
+                  (METALL_BULLET_VELOCITY_X, 0),
+                  (METALL_BULLET_VELOCITY_X, METALL_BULLET_VELOCITY_Y))
+    }
+    
     def __init__(self, x, y, images):
         super().__init__(x, y, METALL_WIDTH, METALL_HEIGHT, METALL_HEALTH)
         self.images = images
         self.guarding = False
         self.bullets = []
+        # Projectiles morts réutilisés par shoot() au lieu d'en allouer de nouveaux
+        self._bullet_pool = []
         self.last_fired = 0
+        # Sprite résolu, recalculé seulement quand direction/garde changent
+        self._image = images["normal"][self.direction]
     
-    def update(self, player_x):
+    def update(self, player_x, now, camera_x=0):
         """
         Met à jour le Metall.
         
         Args:
             player_x: Position X du joueur pour viser
+            now: Temps courant en ms (pygame.time.get_ticks() lu une fois par frame)
+            camera_x: Bord gauche de l'écran dans le monde (les tirs sortis de l'écran disparaissent)
         """
-        # Détermine la direction
-        if player_x < self.x:
-            self.direction = "left"
-        else:
-            self.direction = "right"
+        # Détermine la direction et la garde
+        direction = "left" if player_x < self.x else "right"
+        guarding = abs(self.x - player_x) > METALL_DETECTION_RANGE
+        if direction != self.direction or guarding != self.guarding:
+            self.direction = direction
+            self.guarding = guarding
+            self._image = self.images["guard" if guarding else "normal"][direction]
         
         # Applique la gravité
         self.velocity_y += GRAVITY
         self.y += self.velocity_y
         
         # Tir si le joueur est à portée
-        if abs(self.x - player_x) <= METALL_DETECTION_RANGE:
-            self.guarding = False
-            now = pygame.time.get_ticks()
-            if now - self.last_fired > METALL_FIRE_RATE:
-                self.shoot()
-                self.last_fired = now
-        else:
-            self.guarding = True
-        
-        # Met à jour les projectiles
-        for bullet in self.bullets:
-            bullet.update()
+        if not guarding and now - self.last_fired > METALL_FIRE_RATE:
+            self.shoot()
+            self.last_fired = now
         
-        self.bullets = [b for b in self.bullets 
-                       if not b.used and 0 < b.x < GAME_WIDTH]
+        # Met à jour les projectiles, retire en place ceux utilisés ou hors écran
+        # et les rend au pool
+        bullets = self.bullets
+        recycle = self._bullet_pool.append
+        screen_right = camera_x + GAME_WIDTH
+        kept = 0
+        for bullet in bullets:
+            x = bullet.x + bullet.velocity_x
+            bullet.x = x
+            bullet.y += bullet.velocity_y
+            if not bullet.used and camera_x < x < screen_right:
+                bullets[kept] = bullet
+                kept += 1
+            else:
+                recycle(bullet)
+        del bullets[kept:]
     
     def shoot(self):
         """Tire 3 projectiles dans 3 directions"""
         x = self.x if self.direction == "left" else self.x + self.width
         y = self.y + TILE_SIZE / 2
-        
-        vel_x = -METALL_BULLET_VELOCITY_X if self.direction == "left" else METALL_BULLET_VELOCITY_X
+        pool = self._bullet_pool
         
         # 3 projectiles: haut, milieu, bas
-        self.bullets.append(Metall.Bullet(x, y, vel_x, -METALL_BULLET_VELOCITY_Y, self.images["bullet"]))
-        self.bullets.append(Metall.Bullet(x, y, vel_x, 0, self.images["bullet"]))
-        self.bullets.append(Metall.Bullet(x, y, vel_x, METALL_BULLET_VELOCITY_Y, self.images["bullet"]))
+        for vel_x, vel_y in Metall.SPREAD[self.direction]:
+            if pool:
+                bullet = pool.pop()
+                bullet.reset(x, y, vel_x, vel_y)
+            else:
+                bullet = Metall.Bullet(x, y, vel_x, vel_y, self.images["bullet"])
+            self.bullets.append(bullet)
     
-    def on_land(self):
+    def on_land(self, now):
         """Appelé quand l'ennemi atterrit"""
         self.jumping = False
         self.velocity_y = 0
     
-    def draw(self, screen):
-        """Dessine le Metall"""
-        if self.guarding:
-            image = self.images["guard"][self.direction]
-        else:
-            image = self.images["normal"][self.direction]
-        
-        screen.blit(image, self)
+    def draw(self, screen, camera_x=0):
+        """Dessine le Metall et ses projectiles"""
+        if not self.bullets:
+            if self.is_visible(camera_x):
+                screen.blit(self._image, (self.x - camera_x, self.y))
+            return
         
-        # Dessine les projectiles
-        for bullet in self.bullets:
-            screen.blit(bullet.image, bullet)
+        # Sprite + projectiles soumis en un seul appel SDL
+        # (les projectiles peuvent être à l'écran même si le Metall ne l'est plus)
+        blit_seq = [(self._image, (self.x - camera_x, self.y))] if self.is_visible(camera_x) else []
+        blit_seq += [(bullet.image, (bullet.x - camera_x, bullet.y)) for bullet in self.bullets]
+        screen.blits(blit_seq, doreturn=False)
 
 
 class Blader(Enemy):
@@ -125,6 +175,8 @@ class Blader(Enemy):
     Ennemi Blader - Vole en pattern circulaire.
     """
     
+    __slots__ = ("images", "start_x", "start_y", "velocity_x", "max_range_x", "max_range_y", "_img")
+    
     def __init__(self, x, y, images):
         super().__init__(x, y, BLADER_WIDTH, BLADER_HEIGHT, BLADER_HEALTH)
         self.images = images
@@ -134,30 +186,38 @@ class Blader(Enemy):
         self.velocity_y = BLADER_VELOCITY_Y
         self.max_range_x = BLADER_RANGE_X
         self.max_range_y = BLADER_RANGE_Y
+        # Sprite courant, mis à jour seulement au demi-tour
+        self._img = images[self.direction]
     
-    def update(self, player_x=None):
+    def update(self, player_x=None, now=None, camera_x=0):
         """Met à jour le mouvement du Blader"""
         # Mouvement horizontal
-        if abs(self.x + self.velocity_x - self.start_x) >= self.max_range_x:
-            self.velocity_x *= -1
-            self.direction = "left" if self.velocity_x < 0 else "right"
+        velocity_x = self.velocity_x
+        next_x = self.x + velocity_x
+        if abs(next_x - self.start_x) >= self.max_range_x:
+            self.velocity_x = -velocity_x
+            self.direction = "right" if velocity_x < 0 else "left"
+            self._img = self.images[self.direction]
         else:
-            self.x += self.velocity_x
+            self.x = next_x
         
         # Mouvement vertical
-        if abs(self.y + self.velocity_y - self.start_y) >= self.max_range_y:
-            self.velocity_y *= -1
+        velocity_y = self.velocity_y
+        next_y = self.y + velocity_y
+        if abs(next_y - self.start_y) >= self.max_range_y:
+            self.velocity_y = -velocity_y
         else:
-            self.y += self.velocity_y
+            self.y = next_y
     
-    def on_land(self):
+    def on_land(self, now):
         """Blader vole, donc ne s'arrête pas au sol"""
         pass  # Blader ignore les collisions verticales car il vole
     
-    def draw(self, screen):
+    def draw(self, screen, camera_x=0):
         """Dessine le Blader"""
-        image = self.images[self.direction]
-        screen.blit(image, self)
+        if not self.is_visible(camera_x):
+            return
+        screen.blit(self._img, (self.x - camera_x, self.y))
 
 
 class Gutsman(Enemy):
@@ -165,17 +225,28 @@ class Gutsman(Enemy):
     Boss Gutsman - Saute et lance des rochers.
     """
     
+    __slots__ = ("images", "state", "timer", "velocity_x", "on_ground", "facing_right", "health_bar",
+                 "_frames")
+    
     def __init__(self, x, y, images):
         super().__init__(x, y, GUTSMAN_WIDTH, GUTSMAN_HEIGHT, GUTSMAN_HEALTH)
         self.images = images
         self.state = "idle"  # idle, jump, throw
         self.timer = 0
+        self.velocity_x = 0
         self.velocity_y = 0
         self.on_ground = False
         self.facing_right = False
         self.health_bar = HealthBar()
         
-    def update(self, player_x):
+        # Table aplatie (état, direction) -> Surface, résolue une seule fois
+        self._frames = {
+            (state, direction): images[state][direction]
+            for state in ("idle", "jump", "throw")
+            for direction in ("left", "right")
+        }
+        
+    def update(self, player_x, now, camera_x=0):
         """Met à jour le boss"""
         # Direction
         if player_x < self.x:
@@ -190,8 +261,6 @@ class Gutsman(Enemy):
         self.y += self.velocity_y
         
         # Logique simple d'IA
-        now = pygame.time.get_ticks()
-        
         if self.state == "idle":
             if now - self.timer > 2000:  # 2 secondes d'attente
                 # Décision: Sauter ou Lancer
@@ -218,66 +287,66 @@ class Gutsman(Enemy):
                 Logger.log("STATE", "Gutsman: THROW -> IDLE")
                 # TODO: Créer le projectile ici
     
-    def on_land(self):
+    def on_land(self, now):
         """Atterrissage"""
         if not self.on_ground:
             self.on_ground = True
             self.velocity_y = 0
             self.velocity_x = 0
             self.state = "idle"
-            self.timer = pygame.time.get_ticks()
+            self.timer = now
             Logger.log("STATE", "Gutsman: JUMP -> IDLE (Landed)")
             
             # Tremblement de terre (optionnel)
             # Logger.log("INFO", "Gutsman caused an earthquake!")
 
-    def draw(self, screen):
+    def draw(self, screen, camera_x=0):
         """Dessine Gutsman"""
-        # Choix de l'image selon l'état (simplifié pour l'instant)
-        # On suppose que self.images est un dictionnaire ou une surface unique
-        # Si c'est un dictionnaire, on accède par clé
-        
-        img = self.images  # Par défaut
+        if not self.is_visible(camera_x):
+            return
         
-        if isinstance(self.images, dict):
-            if self.state == "jump":
-                img = self.images.get("jump", self.images.get("idle"))
-            elif self.state == "throw":
-                img = self.images.get("throw", self.images.get("idle"))
-            else:
-                img = self.images.get("idle")
-                
-            # Flip si nécessaire (si les images sont orientées à droite par défaut)
-            # Supposons que les images sont chargées pour les deux directions ou qu'on flip ici
-            # Pour l'instant on suppose que le loader gère les directions comme pour les autres ennemis
-            if isinstance(img, dict):
-                img = img.get(self.direction)
+        x = self.x - camera_x
+        screen.blit(self._frames[(self.state, self.direction)], (x, self.y))
         
-        if img:
-            screen.blit(img, self)
-            
         # Dessine la barre de vie (Composition Pattern)
-        self.health_bar.draw(screen, self.x, self.y - 10, self.health, GUTSMAN_HEALTH)
+        self.health_bar.draw(screen, x, self.y - 10, self.health, GUTSMAN_HEALTH)
 
 
 class HealthBar:
     """
     Barre de vie pour entités (Composition Pattern).
+    La barre est pré-rendue sur une petite surface, redessinée seulement
+    quand la santé change.
     """
+    def __init__(self):
+        self._cached_health = None
+        self._cached_surf = None
+    
     def draw(self, screen, x, y, current_health, max_health):
+        health = (current_health, max_health)
+        if health != self._cached_health:
+            self._cached_surf = self._render(current_health, max_health)
+            self._cached_health = health
+        
+        screen.blit(self._cached_surf, (x, y))
+    
+    def _render(self, current_health, max_health):
+        """Dessine la barre sur une surface dédiée"""
         width = GUTSMAN_WIDTH
         height = 5
+        surf = pygame.Surface((width, height))
         
         # Fond rouge
-        pygame.draw.rect(screen, (255, 0, 0), (x, y, width, height))
+        surf.fill((255, 0, 0))
         
         # Vie verte
         if current_health > 0:
             ratio = current_health / max_health
-            pygame.draw.rect(screen, (0, 255, 0), (x, y, width * ratio, height))
-            
+            pygame.draw.rect(surf, (0, 255, 0), (0, 0, width * ratio, height))
+        
         # Bordure noire
-        pygame.draw.rect(screen, (0, 0, 0), (x, y, width, height), 1)
+        pygame.draw.rect(surf, (0, 0, 0), (0, 0, width, height), 1)
+        return surf
 
 
 class Item(pygame.Rect):
@@ -285,6 +354,8 @@ class Item(pygame.Rect):
     Classe de base pour les objets collectables.
     """
     
+    __slots__ = ("item_type", "value", "image", "velocity_y", "jumping", "used")
+    
     def __init__(self, x, y, width, height, item_type, value, image):
         """
         Args:
@@ -302,6 +373,14 @@ class Item(pygame.Rect):
         self.jumping = True  # L'objet vole vers le haut au départ
         self.used = False
     
+    def reset(self, x, y):
+        """Réinitialise un objet recyclé depuis le pool de la factory"""
+        self.x = x
+        self.y = y
+        self.velocity_y = ITEM_VELOCITY_Y
+        self.jumping = True
+        self.used = False
+    
     def update(self):
         """Met à jour la physique de l'objet"""
         self.velocity_y += GRAVITY
@@ -312,9 +391,9 @@ class Item(pygame.Rect):
         self.jumping = False
         self.velocity_y = 0
     
-    def draw(self, screen):
+    def draw(self, screen, camera_x=0):
         """Dessine l'objet"""
-        screen.blit(self.image, self)
+        screen.blit(self.image, (self.x - camera_x, self.y))
 
 
 def load_enemy_images():
@@ -322,12 +401,22 @@ def load_enemy_images():
     def load_image(name, size):
         try:
             img = pygame.image.load(os.path.join(ASSETS_DIR, name))
-            return pygame.transform.scale(img, size)
+            img = pygame.transform.scale(img, size)
         except:
             Logger.error(f"Could not load image: {name}")
             surf = pygame.Surface(size)
             surf.fill((255, 0, 0))  # Rouge pour erreur
             return surf
+        # Format de l'écran une fois pour toutes (nécessite un mode vidéo)
+        try:
+            return img.convert_alpha()
+        except pygame.error:
+            return img
+    
+    # Gutsman: une seule image chargée et retournée, partagée par tous les états
+    gutsman_right = load_image("gutsman.png", (GUTSMAN_WIDTH, GUTSMAN_HEIGHT))
+    gutsman_left = pygame.transform.flip(gutsman_right, True, False)
+    gutsman_dirs = {"right": gutsman_right, "left": gutsman_left}
     
     images = {
         "metall": {
@@ -346,18 +435,9 @@ def load_enemy_images():
             "left": load_image("blader-left.png", (BLADER_WIDTH, BLADER_HEIGHT))
         },
         "gutsman": {
-            "idle": {
-                "right": load_image("gutsman.png", (GUTSMAN_WIDTH, GUTSMAN_HEIGHT)),
-                "left": pygame.transform.flip(load_image("gutsman.png", (GUTSMAN_WIDTH, GUTSMAN_HEIGHT)), True, False)
-            },
-            "jump": {
-                "right": load_image("gutsman.png", (GUTSMAN_WIDTH, GUTSMAN_HEIGHT)),
-                "left": pygame.transform.flip(load_image("gutsman.png", (GUTSMAN_WIDTH, GUTSMAN_HEIGHT)), True, False)
-            },
-            "throw": {
-                "right": load_image("gutsman.png", (GUTSMAN_WIDTH, GUTSMAN_HEIGHT)),
-                "left": pygame.transform.flip(load_image("gutsman.png", (GUTSMAN_WIDTH, GUTSMAN_HEIGHT)), True, False)
-            }
+            "idle": gutsman_dirs,
+            "jump": gutsman_dirs,
+            "throw": gutsman_dirs
         }
     }
     
@@ -370,12 +450,17 @@ def load_item_images():
     def load_image(name, size):
         try:
             img = pygame.image.load(os.path.join(ASSETS_DIR, name))
-            return pygame.transform.scale(img, size)
+            img = pygame.transform.scale(img, size)
         except:
             Logger.error(f"Could not load image: {name}")
             surf = pygame.Surface(size)
             surf.fill((0, 255, 0))  # Vert pour erreur
             return surf
+        # Format de l'écran une fois pour toutes (nécessite un mode vidéo)
+        try:
+            return img.convert_alpha()
+        except pygame.error:
+            return img
     
     images = {
         "life_energy": load_image("life-energy.png", (LIFE_ENERGY_WIDTH, LIFE_ENERGY_HEIGHT)),
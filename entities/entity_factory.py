@@ -34,6 +34,13 @@ class EnemyFactory(EntityFactory):
     Factory Pattern - Création des ennemis.
     """
     
+    # Dispatch: type d'ennemi -> classe concrète (clé identique dans les images)
+    _ENEMY_CLASSES = {
+        "metall": Metall,
+        "blader": Blader,
+        "gutsman": Gutsman
+    }
+    
     def __init__(self, enemy_images):
         """
         Args:
@@ -47,29 +54,20 @@ class EnemyFactory(EntityFactory):
         Crée un ennemi selon son type.
         
         Args:
-            entity_type: "metall" ou "blader"
+            entity_type: "metall", "blader" ou "gutsman"
             x, y: Position
         
         Returns:
             Enemy: Instance d'ennemi créée
         """
-        enemy = None
-        
-        if entity_type == "metall":
-            enemy = Metall(x, y, self.images["metall"])
-            Logger.log("FACTORY", f"EnemyFactory created Metall at ({x}, {y})")
-            
-        elif entity_type == "blader":
-            enemy = Blader(x, y, self.images["blader"])
-            Logger.log("FACTORY", f"EnemyFactory created Blader at ({x}, {y})")
-            
-        elif entity_type == "gutsman":
-            enemy = Gutsman(x, y, self.images["gutsman"])
-            Logger.log("FACTORY", f"EnemyFactory created Gutsman at ({x}, {y})")
-        
-        else:
+        enemy_class = self._ENEMY_CLASSES.get(entity_type)
+        if enemy_class is None:
             Logger.error(f"Unknown enemy type: {entity_type}")
+            return None
         
+        enemy = enemy_class(x, y, self.images[entity_type])
+        if Logger.enabled_for("FACTORY"):
+            Logger.log("FACTORY", f"EnemyFactory created {enemy_class.__name__} at ({x}, {y})")
         return enemy
 
 
@@ -78,12 +76,29 @@ class ItemFactory(EntityFactory):
     Factory Pattern - Création des objets collectables.
     """
     
+    # Seuils cumulés de drop_random_item (tirage uniforme dans [0, 1))
+    _STRENGTH_THR = 0.05                    # 5% chance de strength up (Rare)
+    _BIG_THR = 0.25                         # 20% chance de big life energy
+    _SMALL_THR = 0.50                       # 25% chance de life energy
+    _BALL_THR = ITEM_DROP_CHANCE / 100.0    # reste: chance de score ball
+    
+    # Dispatch: type d'objet -> (nom pour les logs, largeur, hauteur, valeur)
+    _ITEM_SPECS = {
+        "life_energy": ("LifeEnergy", LIFE_ENERGY_WIDTH, LIFE_ENERGY_HEIGHT, LIFE_ENERGY_HEAL),
+        "big_life_energy": ("BigLifeEnergy", BIG_LIFE_ENERGY_WIDTH, BIG_LIFE_ENERGY_HEIGHT,
+                            BIG_LIFE_ENERGY_HEAL),
+        "score_ball": ("ScoreBall", TILE_SIZE // 2, TILE_SIZE // 2, SCORE_BALL_POINTS),
+        "strength_up": ("StrengthUp", TILE_SIZE, TILE_SIZE, 0)  # Pas de valeur, applique un décorateur
+    }
+    
     def __init__(self, item_images):
         """
         Args:
             item_images: Dictionnaire d'images des objets
         """
         self.images = item_images
+        # Objets ramassés, recyclés par create() au lieu d'en allouer de nouveaux
+        self._pools = {item_type: [] for item_type in self._ITEM_SPECS}
         Logger.log("FACTORY", "ItemFactory initialized")
     
     def create(self, entity_type: str, x: int, y: int, **kwargs):
@@ -91,58 +106,37 @@ class ItemFactory(EntityFactory):
         Crée un objet selon son type.
         
         Args:
-            entity_type: "life_energy", "big_life_energy", ou "score_ball"
+            entity_type: "life_energy", "big_life_energy", "score_ball" ou "strength_up"
             x, y: Position
         
         Returns:
             Item: Instance d'objet créée
         """
-        item = None
-        
-        if entity_type == "life_energy":
-            item = Item(
-                x, y,
-                LIFE_ENERGY_WIDTH, LIFE_ENERGY_HEIGHT,
-                "life_energy",
-                LIFE_ENERGY_HEAL,
-                self.images["life_energy"]
-            )
-            Logger.log("FACTORY", f"ItemFactory created LifeEnergy at ({x}, {y})")
-            
-        elif entity_type == "big_life_energy":
-            item = Item(
-                x, y,
-                BIG_LIFE_ENERGY_WIDTH, BIG_LIFE_ENERGY_HEIGHT,
-                "big_life_energy",
-                BIG_LIFE_ENERGY_HEAL,
-                self.images["big_life_energy"]
-            )
-            Logger.log("FACTORY", f"ItemFactory created BigLifeEnergy at ({x}, {y})")
-            
-            item = Item(
-                x, y,
-                TILE_SIZE // 2, TILE_SIZE // 2,
-                "score_ball",
-                SCORE_BALL_POINTS,
-                self.images["score_ball"]
-            )
-            Logger.log("FACTORY", f"ItemFactory created ScoreBall at ({x}, {y})")
-
-        elif entity_type == "strength_up":
-            item = Item(
-                x, y,
-                TILE_SIZE, TILE_SIZE,
-                "strength_up",
-                0, # No immediate value, applies decorator
-                self.images["strength_up"]
-            )
-            Logger.log("FACTORY", f"ItemFactory created StrengthUp at ({x}, {y})")
-        
-        else:
+        spec = self._ITEM_SPECS.get(entity_type)
+        if spec is None:
             Logger.error(f"Unknown item type: {entity_type}")
+            return None
         
+        name, width, height, value = spec
+        pool = self._pools[entity_type]
+        if pool:
+            item = pool.pop()
+            item.reset(x, y)
+        else:
+            item = Item(x, y, width, height, entity_type, value, self.images[entity_type])
+        if Logger.enabled_for("FACTORY"):
+            Logger.log("FACTORY", f"ItemFactory created {name} at ({x}, {y})")
         return item
     
+    def release(self, item):
+        """
+        Rend un objet ramassé à la factory pour qu'il soit réutilisé.
+        
+        Args:
+            item: Objet qui ne doit plus être affiché ni mis à jour
+        """
+        self._pools[item.item_type].append(item)
+    
     def drop_random_item(self, x: int, y: int):
         """
         Fait apparaître un objet aléatoire (comme drop d'ennemi).
@@ -153,15 +147,15 @@ class ItemFactory(EntityFactory):
         Returns:
             Item or None: Objet créé ou None si pas de drop
         """
-        chance = random.randint(1, 100)
+        chance = random.random()
         
-        if chance <= 5: # 5% chance de strength up (Rare)
+        if chance < self._STRENGTH_THR:
             return self.create("strength_up", x, y)
-        elif chance <= 25:  # 20% chance de big life energy
+        elif chance < self._BIG_THR:
             return self.create("big_life_energy", x, y)
-        elif chance <= 50:  # 30% chance de life energy
+        elif chance < self._SMALL_THR:
             return self.create("life_energy", x, y)
-        elif chance <= ITEM_DROP_CHANCE:  # 25% chance de score ball
+        elif chance < self._BALL_THR:
             return self.create("score_ball", x, y)
         else:
             Logger.log("INFO", f"No item dropped at ({x}, {y})")
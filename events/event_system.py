@@ -4,6 +4,7 @@ Permet aux objets de s'abonner et de réagir aux événements du jeu.
 """
 
 from typing import Dict, List, Callable
+from weakref import WeakKeyDictionary
 from logger import Logger
 from config import *
 
@@ -33,10 +34,21 @@ class EventManager:
     de s'abonner aux événements du jeu.
     """
     
+    # Noms lisibles des types d'événements (construit une seule fois)
+    _EVENT_NAMES = {
+        EVENT_ENEMY_DEFEATED: "ENEMY_DEFEATED",
+        EVENT_ITEM_COLLECTED: "ITEM_COLLECTED",
+        EVENT_PLAYER_HIT: "PLAYER_HIT",
+        EVENT_LEVEL_COMPLETE: "LEVEL_COMPLETE"
+    }
+    
     def __init__(self):
         """Initialise le gestionnaire d'événements"""
-        # Dictionnaire: event_type -> liste d'observateurs
-        self._observers: Dict[int, List[Observer]] = {}
+        # Dictionnaire: event_type -> observateurs (références faibles, ordre d'abonnement conservé).
+        # Un observateur qui n'est plus référencé ailleurs disparaît de lui-même.
+        self._observers: Dict[int, WeakKeyDictionary] = {}
+        # Événements postés pendant la frame, notifiés ensemble par flush()
+        self._queue: List[tuple] = []
         Logger.log("OBSERVER", "EventManager initialized")
     
     def subscribe(self, event_type: int, observer: Observer):
@@ -47,14 +59,16 @@ class EventManager:
             event_type: Type d'événement (EVENT_ENEMY_DEFEATED, etc.)
             observer: Observateur à abonner
         """
-        if event_type not in self._observers:
-            self._observers[event_type] = []
+        observers = self._observers.get(event_type)
+        if observers is None:
+            observers = self._observers[event_type] = WeakKeyDictionary()
         
-        if observer not in self._observers[event_type]:
-            self._observers[event_type].append(observer)
-            event_name = self._get_event_name(event_type)
-            Logger.log("OBSERVER", 
-                      f"Observer {observer.__class__.__name__} subscribed to {event_name}")
+        if observer not in observers:
+            observers[observer] = None
+            if Logger.enabled_for("OBSERVER"):
+                event_name = self._get_event_name(event_type)
+                Logger.log("OBSERVER", 
+                          f"Observer {observer.__class__.__name__} subscribed to {event_name}")
     
     def unsubscribe(self, event_type: int, observer: Observer):
         """
@@ -64,11 +78,19 @@ class EventManager:
             event_type: Type d'événement
             observer: Observateur à désabonner
         """
-        if event_type in self._observers and observer in self._observers[event_type]:
-            self._observers[event_type].remove(observer)
-            event_name = self._get_event_name(event_type)
-            Logger.log("OBSERVER", 
-                      f"Observer {observer.__class__.__name__} unsubscribed from {event_name}")
+        observers = self._observers.get(event_type)
+        if observers is not None and observer in observers:
+            del observers[observer]
+            if Logger.enabled_for("OBSERVER"):
+                event_name = self._get_event_name(event_type)
+                Logger.log("OBSERVER", 
+                          f"Observer {observer.__class__.__name__} unsubscribed from {event_name}")
+    
+    def clear(self):
+        """Désabonne tous les observateurs de tous les événements (et oublie ceux en attente)"""
+        self._observers.clear()
+        self._queue.clear()
+        Logger.log("OBSERVER", "All observers unsubscribed")
     
     def notify_observers(self, event_type: int, data: dict = None):
         """
@@ -78,24 +100,45 @@ class EventManager:
             event_type: Type d'événement qui s'est produit
             data: Données optionnelles liées à l'événement
         """
-        if event_type in self._observers:
+        observers = self._observers.get(event_type)
+        if not observers:
+            return
+        
+        if Logger.enabled_for("OBSERVER"):
             event_name = self._get_event_name(event_type)
-            observer_count = len(self._observers[event_type])
             Logger.log("OBSERVER", 
-                      f"Event {event_name} notified to {observer_count} observer(s)")
-            
-            for observer in self._observers[event_type]:
-                observer.notify(event_type, data)
+                      f"Event {event_name} notified to {len(observers)} observer(s)")
+        
+        for observer in observers:
+            observer.notify(event_type, data)
+    
+    def post(self, event_type: int, data: dict = None):
+        """
+        Met un événement en file: il sera notifié au prochain flush().
+        
+        Args:
+            event_type: Type d'événement qui s'est produit
+            data: Données optionnelles liées à l'événement
+        """
+        self._queue.append((event_type, data))
+    
+    def flush(self):
+        """Notifie, dans l'ordre, les événements postés depuis le dernier flush()"""
+        queue = self._queue
+        if not queue:
+            return
+        # Les événements postés pendant la notification attendent le flush suivant
+        self._queue = []
+        notify = self.notify_observers
+        for event_type, data in queue:
+            notify(event_type, data)
     
     def _get_event_name(self, event_type: int) -> str:
         """Retourne le nom lisible d'un type d'événement"""
-        event_names = {
-            EVENT_ENEMY_DEFEATED: "ENEMY_DEFEATED",
-            EVENT_ITEM_COLLECTED: "ITEM_COLLECTED",
-            EVENT_PLAYER_HIT: "PLAYER_HIT",
-            EVENT_LEVEL_COMPLETE: "LEVEL_COMPLETE"
-        }
-        return event_names.get(event_type, f"UNKNOWN_EVENT_{event_type}")
+        name = self._EVENT_NAMES.get(event_type)
+        if name is None:
+            name = f"UNKNOWN_EVENT_{event_type}"
+        return name
 
 
 # Test du pattern Observer
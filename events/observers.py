@@ -71,33 +71,40 @@ class SoundObserver(Observer):
     (Implémentation simplifiée sans sons réels pour ce projet)
     """
     
+    # Fichier son associé à chaque type d'événement
+    SOUND_FILES = {
+        EVENT_ENEMY_DEFEATED: "enemy_defeat.wav",
+        EVENT_ITEM_COLLECTED: "item_collect.wav",
+        EVENT_PLAYER_HIT: "player_hit.wav",
+        EVENT_LEVEL_COMPLETE: "level_complete.wav"
+    }
+    
     def __init__(self):
+        # Sons préchargés une seule fois: event_type -> pygame.mixer.Sound
+        self._sounds = {}
         try:
             pygame.mixer.init()
             Logger.log("OBSERVER", "SoundObserver initialized (Mixer ready)")
         except:
             Logger.error("Could not initialize pygame mixer")
-    
-    def notify(self, event_type: int, data: dict = None):
-        """Réagit aux événements pour jouer des sons"""
-        sound_map = {
-            EVENT_ENEMY_DEFEATED: "enemy_defeat.wav",
-            EVENT_ITEM_COLLECTED: "item_collect.wav",
-            EVENT_PLAYER_HIT: "player_hit.wav",
-            EVENT_LEVEL_COMPLETE: "level_complete.wav"
-        }
+            return
         
-        if event_type in sound_map:
-            sound_file = sound_map[event_type]
+        for event_type, sound_file in self.SOUND_FILES.items():
             # Vérifie si le fichier existe
             if os.path.exists(sound_file):
                 try:
-                    pygame.mixer.Sound(sound_file).play()
+                    self._sounds[event_type] = pygame.mixer.Sound(sound_file)
                 except:
                     pass
             else:
                 # Logger.log("INFO", f"Sound file missing: {sound_file}")
                 pass
+    
+    def notify(self, event_type: int, data: dict = None):
+        """Réagit aux événements pour jouer des sons"""
+        sound = self._sounds.get(event_type)
+        if sound is not None:
+            sound.play()
 
 
 class AchievementObserver(Observer):
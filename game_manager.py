@@ -22,22 +22,25 @@ class GameManager:
     
     _instance = None
     
+    # Nombre maximal de textes rendus gardés en cache
+    TEXT_CACHE_SIZE = 128
+    
     def __new__(cls):
         """
         Implémente le pattern Singleton.
-        Garantit qu'une seule instance de GameManager existe.
+        Garantit qu'une seule instance de GameManager existe: l'initialisation
+        est faite ici, une seule fois, et les appels suivants renvoient
+        directement l'instance sans repasser par un __init__.
         """
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+            instance = super().__new__(cls)
             Logger.log("SINGLETON", "GameManager instance created")
+            instance._setup()
+            cls._instance = instance
         return cls._instance
     
-    def __init__(self):
-        """Initialise le GameManager une seule fois"""
-        if self._initialized:
-            return
-        
+    def _setup(self):
+        """Initialise le GameManager (appelé une seule fois par __new__)"""
         Logger.log("SINGLETON", "GameManager initialization starting")
         
         # État du jeu
@@ -51,6 +54,13 @@ class GameManager:
         self.enemies_defeated = 0
         self.items_collected = 0
         
+        # Dernier score formaté (le HUD le demande à chaque frame)
+        self._score_cache_val = None
+        self._score_cache_str = ""
+        
+        # Surfaces de texte déjà rendues: (texte, couleur, antialias) -> Surface
+        self._text_cache = {}
+        
         # Configuration Pygame
         self.screen = None
         self.clock = None
@@ -61,7 +71,6 @@ class GameManager:
         self.player = None
         self.current_level_obj = None
         
-        self._initialized = True
         Logger.log("SINGLETON", "GameManager initialization complete")
     
     @classmethod
@@ -72,16 +81,15 @@ class GameManager:
         Returns:
             GameManager: L'instance unique du gestionnaire
         """
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        return cls._instance or cls()
     
     def initialize_pygame(self):
         """Initialise Pygame et crée la fenêtre"""
         pygame.init()
         pygame.font.init()
         
-        self.screen = pygame.display.set_mode((GAME_WIDTH, GAME_HEIGHT))
+        # Double tampon: l'écran défile en entier à chaque frame, il est présenté d'un bloc par flip()
+        self.screen = pygame.display.set_mode((GAME_WIDTH, GAME_HEIGHT), pygame.DOUBLEBUF)
         pygame.display.set_caption("Megaman - Design Patterns Project")
         
         self.clock = pygame.time.Clock()
@@ -91,9 +99,37 @@ class GameManager:
         except:
             Logger.error(f"Could not load font {FONT_PATH}, using default")
             self.font = pygame.font.SysFont("Arial", FONT_SIZE)
+        self._text_cache.clear()
         
         Logger.log("INFO", "Pygame initialized successfully")
     
+    def render_text(self, text: str, color=COLOR_WHITE, antialias: bool = False) -> pygame.Surface:
+        """
+        Rend un texte avec la police du jeu, en réutilisant la surface si ce
+        texte a déjà été rendu (le HUD redessine les mêmes textes à chaque frame).
+        
+        Args:
+            text: Texte à afficher
+            color: Couleur du texte
+            antialias: Lissage des caractères
+        
+        Returns:
+            pygame.Surface: Surface du texte (partagée, ne pas modifier)
+        """
+        key = (text, color, antialias)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self.font.render(text, antialias, color)
+            try:
+                surface = surface.convert_alpha()
+            except pygame.error:
+                pass  # Pas encore de mode vidéo (tests)
+            if len(self._text_cache) >= self.TEXT_CACHE_SIZE:
+                # Évince le texte le plus ancien (ordre d'insertion du dict)
+                del self._text_cache[next(iter(self._text_cache))]
+            self._text_cache[key] = surface
+        return surface
+    
     def add_score(self, points: int):
         """
         Ajoute des points au score.
@@ -152,10 +188,22 @@ class GameManager:
         Returns:
             str: Score formaté (ex: "0001500")
         """
-        score_str = str(self.score)
-        while len(score_str) < SCORE_DIGITS:
-            score_str = "0" + score_str
-        return score_str
+        if self.score != self._score_cache_val:
+            self._score_cache_str = f"{self.score:0{SCORE_DIGITS}d}"
+            self._score_cache_val = self.score
+        return self._score_cache_str
+
+
+def __getattr__(name):
+    """
+    Attribut de module paresseux (PEP 562): `from game_manager import GM`
+    crée l'instance unique au premier accès puis la met en cache dans le module.
+    """
+    if name == "GM":
+        global GM
+        GM = GameManager()
+        return GM
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Test du Singleton
@@ -1,11 +1,13 @@
 """Levels package - Composite Pattern"""
 
-from levels.level_components import GameComponent, Tile, Zone, Level
+from levels.level_components import GameComponent, TileType, Tile, StaticBackground, Zone, Level
 from levels.level_loader import LevelLoader, load_tile_images
 
 __all__ = [
     'GameComponent',
+    'TileType',
     'Tile',
+    'StaticBackground',
     'Zone',
     'Level',
     'LevelLoader',
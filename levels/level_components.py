@@ -4,23 +4,47 @@ Permet de traiter uniformément objets simples et composites.
 """
 
 import pygame
-from typing import List
+from typing import List, NamedTuple
 from logger import Logger
 from config import *
 
 
+def _swap_pop(items: list, index: dict, component) -> bool:
+    """
+    Retire un composant d'une liste en O(1): le dernier élément prend sa place.
+    
+    Args:
+        items: Liste de composants (l'ordre n'est pas conservé)
+        index: id(composant) -> position dans items, tenu à jour
+        component: Composant à retirer
+    
+    Returns:
+        bool: False si le composant n'était pas dans la liste
+    """
+    i = index.pop(id(component), None)
+    if i is None:
+        return False
+    last = items.pop()
+    if i != len(items):
+        items[i] = last
+        index[id(last)] = i
+    return True
+
+
 class GameComponent:
     """
     Interface Component pour le Composite Pattern.
     Définit les opérations communes aux objets simples et composites.
     """
     
+    __slots__ = ()
+    
     def update(self):
         """Met à jour le composant"""
         raise NotImplementedError
     
-    def render(self, screen):
-        """Dessine le composant"""
+    def render(self, screen, camera_x: int = 0):
+        """Dessine le composant, décalé de la position de la caméra"""
         raise NotImplementedError
     
     def add(self, component: 'GameComponent'):
@@ -36,29 +60,50 @@ class GameComponent:
         raise NotImplementedError
 
 
+class TileType(NamedTuple):
+    """
+    Flyweight - Données partagées par toutes les tuiles d'un même type.
+    """
+    image: pygame.Surface
+    is_solid: bool
+
+
 class Tile(GameComponent, pygame.Rect):
     """
     Leaf - Tuile individuelle (objet simple).
+    Ne stocke que sa position et une référence vers son TileType partagé.
     """
     
-    def __init__(self, x: int, y: int, image, is_solid: bool = True):
+    __slots__ = ("tile_type",)
+    
+    def __init__(self, x: int, y: int, image=None, is_solid: bool = True, tile_type: TileType = None):
         """
         Args:
             x, y: Position
-            image: Image de la tuile
-            is_solid: Si True, la tuile a des collisions
+            image: Image de la tuile (ignoré si tile_type est fourni)
+            is_solid: Si True, la tuile a des collisions (ignoré si tile_type est fourni)
+            tile_type: Type partagé (flyweight) à utiliser directement
         """
         pygame.Rect.__init__(self, x, y, TILE_SIZE, TILE_SIZE)
-        self.image = image
-        self.is_solid = is_solid
+        self.tile_type = tile_type if tile_type is not None else TileType(image, is_solid)
+    
+    @property
+    def image(self):
+        """Image de la tuile (partagée par son type)"""
+        return self.tile_type.image
+    
+    @property
+    def is_solid(self) -> bool:
+        """Si True, la tuile a des collisions"""
+        return self.tile_type.is_solid
     
     def update(self):
         """Les tuiles statiques ne se mettent pas à jour"""
         pass
     
-    def render(self, screen):
+    def render(self, screen, camera_x: int = 0):
         """Dessine la tuile"""
-        screen.blit(self.image, self)
+        screen.blit(self.image, (self.x - camera_x, self.y))
     
     def add(self, component):
         """Les feuilles ne peuvent pas avoir d'enfants"""
@@ -70,7 +115,35 @@ class Tile(GameComponent, pygame.Rect):
     
     def get_children(self):
         """Les feuilles n'ont pas d'enfants"""
-        return []
+        return ()
+
+
+class StaticBackground(Tile):
+    """
+    Leaf - Décor statique pré-composé.
+    Fusionne en une seule surface des tuiles non solides qui ne changent jamais,
+    pour les dessiner en un seul blit par frame.
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self, tiles: List[Tile], width: int, height: int):
+        """
+        Args:
+            tiles: Tuiles de décor à fusionner (positions relatives au coin du niveau)
+            width, height: Dimensions du niveau en pixels
+        """
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        for tile in tiles:
+            # Les tuiles ne se chevauchent pas: copie exacte des pixels, alpha compris
+            surface.blit(tile.image, tile, special_flags=pygame.BLEND_RGBA_MAX)
+        try:
+            surface = surface.convert_alpha()
+        except pygame.error:
+            pass  # Pas encore de mode vidéo (tests)
+        
+        Tile.__init__(self, 0, 0, surface, is_solid=False)
+        self.size = (width, height)
 
 
 class Zone(GameComponent):
@@ -79,6 +152,9 @@ class Zone(GameComponent):
     Une zone peut contenir des tiles, des hazards, etc.
     """
     
+    __slots__ = ("name", "_components", "_tiles", "_subzones", "_dynamic",
+                 "_index", "_typed_index", "_parent", "_solid_tiles", "_blit_seq")
+    
     def __init__(self, name: str):
         """
         Args:
@@ -86,42 +162,117 @@ class Zone(GameComponent):
         """
         self.name = name
         self._components: List[GameComponent] = []
+        # Sous-collections typées, classées une fois à l'ajout:
+        # tuiles statiques, sous-zones, et autres composants (mis à jour chaque frame)
+        self._tiles: List[Tile] = []
+        self._subzones: List['Zone'] = []
+        self._dynamic: List[GameComponent] = []
+        # Positions par identité (id -> index) dans _components et dans la sous-collection
+        # typée: retrait en O(1), et les tuiles (des Rect comparés par valeur) ne sont pas confondues
+        self._index = {}
+        self._typed_index = {}
+        # Composite parent (Zone ou Level) à prévenir quand le contenu change
+        self._parent = None
+        # Caches aplatis (tuiles solides, séquence de blits), reconstruits après add/remove
+        self._solid_tiles: List[Tile] = None
+        self._blit_seq = None
         Logger.log("COMPOSITE", f"Zone '{name}' created")
     
     def update(self):
-        """Met à jour tous les composants de la zone"""
-        for component in self._components:
+        """Met à jour les composants de la zone (les tuiles statiques n'ont rien à faire)"""
+        for component in self._dynamic:
             component.update()
+        for zone in self._subzones:
+            zone.update()
     
-    def render(self, screen):
-        """Dessine tous les composants de la zone"""
-        for component in self._components:
-            component.render(screen)
+    def render(self, screen, camera_x: int = 0):
+        """Dessine les tuiles de la zone en un seul appel blits, puis les autres composants"""
+        blit_seq = self.get_blit_sequence()
+        if camera_x:
+            blit_seq = [(image, tile.move(-camera_x, 0)) for image, tile in blit_seq]
+        screen.blits(blit_seq, doreturn=False)
+        self.render_dynamic(screen, camera_x)
+    
+    def render_dynamic(self, screen, camera_x: int = 0):
+        """Dessine les composants qui ne sont pas des tuiles (zone et sous-zones)"""
+        for component in self._dynamic:
+            component.render(screen, camera_x)
+        for zone in self._subzones:
+            zone.render_dynamic(screen, camera_x)
     
     def add(self, component: GameComponent):
         """Ajoute un composant à la zone"""
+        if id(component) in self._index:
+            return
+        self._index[id(component)] = len(self._components)
         self._components.append(component)
+        if isinstance(component, Tile):
+            typed = self._tiles
+        elif isinstance(component, Zone):
+            typed = self._subzones
+            component._parent = self
+        else:
+            typed = self._dynamic
+        self._typed_index[id(component)] = len(typed)
+        typed.append(component)
+        self._invalidate()
         # Logger.log("COMPOSITE", f"Component added to Zone '{self.name}'")  # Trop verbeux
     
     def remove(self, component: GameComponent):
-        """Retire un composant de la zone"""
-        if component in self._components:
-            self._components.remove(component)
+        """Retire un composant de la zone (l'ordre des composants restants n'est pas conservé)"""
+        if _swap_pop(self._components, self._index, component):
+            if isinstance(component, Tile):
+                _swap_pop(self._tiles, self._typed_index, component)
+            elif isinstance(component, Zone):
+                _swap_pop(self._subzones, self._typed_index, component)
+                component._parent = None
+            else:
+                _swap_pop(self._dynamic, self._typed_index, component)
+            self._invalidate()
             # Logger.log("COMPOSITE", f"Component removed from Zone '{self.name}'")
     
     def get_children(self):
-        """Retourne les composants de la zone"""
+        """
+        Retourne les composants de la zone.
+        La liste est celle de la zone (pas de copie): elle ne doit pas être
+        modifiée, ni parcourue pendant un add/remove (voir get_children_copy).
+        """
+        return self._components
+    
+    def get_children_copy(self):
+        """Retourne une copie des composants de la zone, modifiable par l'appelant"""
         return self._components.copy()
     
     def get_solid_tiles(self) -> List[Tile]:
-        """Retourne toutes les tuiles solides de cette zone"""
-        tiles = []
-        for component in self._components:
-            if isinstance(component, Tile) and component.is_solid:
-                tiles.append(component)
-            elif isinstance(component, Zone):
-                tiles.extend(component.get_solid_tiles())
-        return tiles
+        """
+        Retourne toutes les tuiles solides de cette zone.
+        La liste est mise en cache: elle ne doit pas être modifiée par l'appelant.
+        """
+        if self._solid_tiles is None:
+            tiles = [tile for tile in self._tiles if tile.is_solid]
+            for zone in self._subzones:
+                tiles.extend(zone.get_solid_tiles())
+            self._solid_tiles = tiles
+        return self._solid_tiles
+    
+    def get_blit_sequence(self):
+        """
+        Retourne la séquence (image, tuile) de la zone puis de ses sous-zones,
+        prête pour Surface.blits (positions dans le monde, sans la caméra).
+        """
+        if self._blit_seq is None:
+            blit_seq = [(tile.image, tile) for tile in self._tiles]
+            for zone in self._subzones:
+                blit_seq.extend(zone.get_blit_sequence())
+            self._blit_seq = blit_seq
+        return self._blit_seq
+    
+    def _invalidate(self):
+        """Invalide les caches aplatis et propage au parent"""
+        self._solid_tiles = None
+        self._blit_seq = None
+        if self._parent is not None:
+            self._parent._invalidate()
 
 
 class Level(GameComponent):
@@ -129,6 +280,9 @@ class Level(GameComponent):
     Composite - Niveau complet contenant plusieurs zones.
     """
     
+    __slots__ = ("level_number", "_zones", "_solid_tiles", "_blit_columns", "_blit_wide", "_solid_grid",
+                 "_solid_grid_spans")
+    
     def __init__(self, level_number: int):
         """
         Args:
@@ -136,6 +290,16 @@ class Level(GameComponent):
         """
         self.level_number = level_number
         self._zones: List[Zone] = []
+        # Caches de toutes les zones, reconstruits seulement après un changement
+        self._solid_tiles: List[Tile] = None
+        # Blits regroupés par colonne de tuiles du monde pour le culling, plus les
+        # éléments plus larges qu'une tuile (décor pré-composé), toujours dessinés
+        self._blit_columns = None
+        self._blit_wide = None
+        # Grille spatiale des tuiles solides: (colonne, ligne) -> tuiles couvrant la case,
+        # et présence de tuiles sur plusieurs cases (résultats à dédoublonner)
+        self._solid_grid = None
+        self._solid_grid_spans = False
         Logger.log("COMPOSITE", f"Level {level_number} created")
     
     def update(self):
@@ -143,36 +307,155 @@ class Level(GameComponent):
         for zone in self._zones:
             zone.update()
     
-    def render(self, screen):
-        """Dessine toutes les zones"""
+    def render(self, screen, camera_x: int = 0):
+        """
+        Dessine les tuiles visibles de toutes les zones en un seul appel blits.
+        
+        Args:
+            screen: Surface Pygame
+            camera_x: Position du bord gauche de l'écran dans le niveau
+        """
+        if self._blit_columns is None:
+            self._build_blit_columns()
+        
+        # Colonnes qui chevauchent l'écran
+        first_col = max(0, camera_x // TILE_SIZE)
+        last_col = (camera_x + screen.get_width() - 1) // TILE_SIZE
+        offset = -camera_x
+        blit_seq = [(image, rect.move(offset, 0)) for image, rect in self._blit_wide]
+        blit_seq += [(image, tile.move(offset, 0))
+                     for column in self._blit_columns[first_col:last_col + 1]
+                     for image, tile in column]
+        screen.blits(blit_seq, doreturn=False)
+        
         for zone in self._zones:
-            zone.render(screen)
+            zone.render_dynamic(screen, camera_x)
+    
+    def _build_blit_columns(self):
+        """
+        Range la séquence de blits des zones par colonne de tuiles.
+        Des tuiles de colonnes différentes ne se chevauchent pas: seul l'ordre
+        au sein d'une colonne compte, et il est conservé.
+        """
+        blit_seq = []
+        for zone in self._zones:
+            blit_seq.extend(zone.get_blit_sequence())
+        
+        # Éléments hors grille (décor pré-composé, ou à gauche du niveau): toujours dessinés
+        self._blit_wide = [blit for blit in blit_seq if blit[1].width > TILE_SIZE or blit[1].x < 0]
+        tiles = [blit for blit in blit_seq if blit[1].width <= TILE_SIZE and blit[1].x >= 0]
+        self._blit_columns = []
+        for blit in tiles:
+            col = blit[1].x // TILE_SIZE
+            while len(self._blit_columns) <= col:
+                self._blit_columns.append([])
+            self._blit_columns[col].append(blit)
     
     def add(self, zone: Zone):
         """Ajoute une zone au niveau"""
         if isinstance(zone, Zone):
             self._zones.append(zone)
+            zone._parent = self
+            self._invalidate()
             Logger.log("COMPOSITE", f"Zone '{zone.name}' added to Level {self.level_number}")
         else:
             Logger.error("Only Zone objects can be added to Level")
     
     def remove(self, zone: Zone):
-        """Retire une zone du niveau"""
-        if zone in self._zones:
+        """Retire une zone du niveau (l'ordre des zones restantes, qui fixe l'ordre de dessin, est conservé)"""
+        try:
             self._zones.remove(zone)
-            Logger.log("COMPOSITE", f"Zone '{zone.name}' removed from Level {self.level_number}")
+        except ValueError:
+            return
+        zone._parent = None
+        self._invalidate()
+        Logger.log("COMPOSITE", f"Zone '{zone.name}' removed from Level {self.level_number}")
     
     def get_children(self):
-        """Retourne les zones du niveau"""
+        """
+        Retourne les zones du niveau.
+        La liste est celle du niveau (pas de copie): elle ne doit pas être
+        modifiée, ni parcourue pendant un add/remove (voir get_children_copy).
+        """
+        return self._zones
+    
+    def get_children_copy(self):
+        """Retourne une copie des zones du niveau, modifiable par l'appelant"""
         return self._zones.copy()
     
     def get_all_solid_tiles(self) -> List[Tile]:
-        """Retourne toutes les tuiles solides du niveau"""
+        """
+        Retourne toutes les tuiles solides du niveau.
+        La liste est mise en cache: elle ne doit pas être modifiée par l'appelant.
+        """
+        if self._solid_tiles is None:
+            tiles = []
+            for zone in self._zones:
+                tiles.extend(zone.get_solid_tiles())
+            self._solid_tiles = tiles
+        return self._solid_tiles
+    
+    def tiles_near(self, rect) -> List[Tile]:
+        """
+        Retourne les tuiles solides dont une case chevauche le rectangle donné,
+        ligne par ligne (même ordre que get_all_solid_tiles pour des tuiles
+        alignées sur la grille), chaque tuile une seule fois.
+        
+        Les tuiles ne bougent pas (le défilement est une caméra): la grille est
+        construite une fois par niveau. Une tuile non alignée ou plus grande
+        qu'une case est indexée dans toutes les cases qu'elle couvre.
+        
+        Args:
+            rect: Zone de recherche (ex: hitbox d'une entité)
+        """
+        if self._solid_grid is None:
+            self._build_solid_grid()
+        
+        grid = self._solid_grid
+        first_col = rect.left // TILE_SIZE
+        last_col = (rect.right - 1) // TILE_SIZE
+        first_row = rect.top // TILE_SIZE
+        last_row = (rect.bottom - 1) // TILE_SIZE
         tiles = []
-        for zone in self._zones:
-            tiles.extend(zone.get_solid_tiles())
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                cell = grid.get((col, row))
+                if cell is not None:
+                    tiles.extend(cell)
+        # Une tuile sur plusieurs cases peut être trouvée plusieurs fois
+        if self._solid_grid_spans and len(tiles) > 1:
+            seen = set()
+            tiles = [tile for tile in tiles if not (id(tile) in seen or seen.add(id(tile)))]
         return tiles
     
+    def _build_solid_grid(self):
+        """Indexe les tuiles solides dans chaque case du niveau qu'elles couvrent"""
+        grid = {}
+        spans = False
+        for tile in self.get_all_solid_tiles():
+            first_col = tile.left // TILE_SIZE
+            last_col = max(first_col, (tile.right - 1) // TILE_SIZE)
+            first_row = tile.top // TILE_SIZE
+            last_row = max(first_row, (tile.bottom - 1) // TILE_SIZE)
+            if last_col != first_col or last_row != first_row:
+                spans = True
+            for row in range(first_row, last_row + 1):
+                for col in range(first_col, last_col + 1):
+                    cell = grid.get((col, row))
+                    if cell is None:
+                        grid[(col, row)] = [tile]
+                    else:
+                        cell.append(tile)
+        self._solid_grid = grid
+        self._solid_grid_spans = spans
+    
+    def _invalidate(self):
+        """Invalide les caches aplatis"""
+        self._solid_tiles = None
+        self._blit_columns = None
+        self._blit_wide = None
+        self._solid_grid = None
+    
     def get_zone_by_name(self, name: str) -> Zone:
         """Trouve une zone par son nom"""
         for zone in self._zones:
@@ -4,37 +4,78 @@ Chargeur de niveaux (Composite + Factory)
 
 import pygame
 import os
+from types import MappingProxyType
 from typing import List
-from levels.level_components import Level, Zone, Tile
+from levels.level_components import Level, Zone, Tile, TileType, StaticBackground
 from entities import EnemyFactory, ItemFactory, Enemy
 from logger import Logger
 from config import *
 import tile_map
 
 
+def _pack_atlas(images: dict, alpha: bool) -> dict:
+    """
+    Regroupe des tuiles dans un atlas unique (une rangée de tuiles).
+    
+    Args:
+        images: Dictionnaire nom -> Surface de taille TILE_SIZE
+        alpha: True si l'atlas doit garder la transparence
+    
+    Returns:
+        dict: nom -> sous-surface de l'atlas (partage ses pixels)
+    """
+    atlas = pygame.Surface((TILE_SIZE * len(images), TILE_SIZE), pygame.SRCALPHA if alpha else 0)
+    try:
+        atlas = atlas.convert_alpha() if alpha else atlas.convert()
+    except pygame.error:
+        pass  # Pas encore de mode vidéo (tests)
+    
+    regions = {}
+    for index, (name, image) in enumerate(images.items()):
+        region = pygame.Rect(index * TILE_SIZE, 0, TILE_SIZE, TILE_SIZE)
+        # L'atlas transparent est vide: copie exacte des pixels, alpha compris
+        atlas.blit(image, region, special_flags=pygame.BLEND_RGBA_MAX if alpha else 0)
+        regions[name] = atlas.subsurface(region)
+    return regions
+
+
 def load_tile_images():
-    """Charge les images de tuiles."""
-    def load_image(name, size):
+    """
+    Charge les images de tuiles.
+    Les tuiles opaques sont converties au format de l'écran (convert), celles
+    avec transparence (beam, spike) gardent leur canal alpha (convert_alpha).
+    Chaque groupe est rangé dans un atlas: les images renvoyées en sont des
+    sous-surfaces, tous les blits de tuiles lisent donc deux surfaces sources.
+    """
+    def load_image(name, size, alpha=False):
         try:
             img = pygame.image.load(os.path.join(ASSETS_DIR, name))
-            return pygame.transform.scale(img, size)
+            img = pygame.transform.scale(img, size)
         except:
             Logger.error(f"Could not load tile image: {name}")
             surf = pygame.Surface(size)
             surf.fill((128, 128, 128))
             return surf
-    images = {
+        try:
+            return img.convert_alpha() if alpha else img.convert()
+        except pygame.error:
+            return img  # Pas encore de mode vidéo (tests)
+    opaque = {
         "floor": load_image("floor-tile.png", (TILE_SIZE, TILE_SIZE)),
         "wall": load_image("wall-tile.png", (TILE_SIZE, TILE_SIZE)),
-        "beam": load_image("beam-tile.png", (TILE_SIZE, TILE_SIZE)),
         "rock1": load_image("rock-tile1.png", (TILE_SIZE, TILE_SIZE)),
         "rock2": load_image("rock-tile2.png", (TILE_SIZE, TILE_SIZE)),
         "rock3": load_image("rock-tile3.png", (TILE_SIZE, TILE_SIZE)),
         "rock4": load_image("rock-tile4.png", (TILE_SIZE, TILE_SIZE)),
         "door": load_image("door-tile.png", (TILE_SIZE, TILE_SIZE)),
         "room": load_image("room-tile.png", (TILE_SIZE, TILE_SIZE)),
-        "spike": load_image("spike.png", (TILE_SIZE, TILE_SIZE)),
     }
+    transparent = {
+        "beam": load_image("beam-tile.png", (TILE_SIZE, TILE_SIZE), alpha=True),
+        "spike": load_image("spike.png", (TILE_SIZE, TILE_SIZE), alpha=True),
+    }
+    images = _pack_atlas(opaque, alpha=False)
+    images.update(_pack_atlas(transparent, alpha=True))
     Logger.log("INFO", "Tile images loaded")
     return images
 
@@ -43,6 +84,27 @@ class LevelLoader:
     """
     Charge un niveau depuis une tile map.
     """
+    # Tuiles de terrain: solides, ou décor si le code est négatif
+    TERRAIN_CODES = (
+        (TILE_ROCK1, "rock1"),
+        (TILE_ROCK2, "rock2"),
+        (TILE_ROCK3, "rock3"),
+        (TILE_ROCK4, "rock4"),
+        (TILE_FLOOR, "floor"),
+        (TILE_WALL, "wall"),
+    )
+    # Tuiles de décor (jamais solides)
+    DECOR_CODES = (
+        (TILE_BEAM, "beam"),
+        (TILE_DOOR, "door"),
+        (TILE_ROOM, "room"),
+    )
+    # Ennemis: code -> type pour l'EnemyFactory
+    ENEMY_CODES = MappingProxyType({
+        TILE_METALL: "metall",
+        TILE_BLADER: "blader",
+        TILE_GUTSMAN: "gutsman",
+    })
     def __init__(self, enemy_factory: EnemyFactory, tile_images: dict):
         """
         Args:
@@ -51,12 +113,23 @@ class LevelLoader:
         """
         self.enemy_factory = enemy_factory
         self.tile_images = tile_images
+        # Flyweights: un TileType par code de tuile, partagé par toutes les tuiles de ce code
+        # (table figée: codes positifs et négatifs ont chacun leur entrée, sans abs() au parsing)
+        tile_types = {}
+        for code, name in self.TERRAIN_CODES:
+            tile_types[code] = TileType(tile_images[name], True)
+            tile_types[-code] = TileType(tile_images[name], False)
+        for code, name in self.DECOR_CODES:
+            tile_types[code] = TileType(tile_images[name], False)
+        tile_types[TILE_SPIKE] = TileType(tile_images["spike"], False)
+        self.tile_types = MappingProxyType(tile_types)
         Logger.log("INFO", "LevelLoader prêt")
     def load_level(self, level_number: int = 1) -> tuple[Level, List[Enemy], List[Tile]]:
         """
         Charge un niveau depuis le tile map.
         """
-        Logger.log("COMPOSITE", f"Loading level {level_number}...")
+        if Logger.enabled_for("COMPOSITE"):
+            Logger.log("COMPOSITE", f"Loading level {level_number}...")
         # Choisit la carte du niveau
         map_index = (level_number - 1) % len(tile_map.GAME_MAPS)
         game_map = tile_map.GAME_MAPS[map_index]
@@ -70,84 +143,55 @@ class LevelLoader:
         # Listes entités
         enemies = []
         spikes = []
-        # Parse la tile map
-        for row_idx in range(len(game_map)):
-            for col_idx in range(len(game_map[row_idx])):
-                map_code = game_map[row_idx][col_idx]
-                x = col_idx * TILE_SIZE
-                y = row_idx * TILE_SIZE
+        # Table de dispatch: code -> (type de tuile, zone), liée aux zones de ce niveau.
+        # Codes négatifs = background
+        tile_handlers = {}
+        for code, _ in self.TERRAIN_CODES:
+            tile_handlers[code] = (self.tile_types[code], solid_zone)
+            tile_handlers[-code] = (self.tile_types[-code], background_zone)
+        for code, _ in self.DECOR_CODES:
+            tile_handlers[code] = (self.tile_types[code], background_zone)
+        # Références locales pour la boucle de parsing (pas de self. par case)
+        get_handler = tile_handlers.get
+        enemy_codes = self.ENEMY_CODES
+        create_enemy = self.enemy_factory.create
+        spike_type = self.tile_types[TILE_SPIKE]
+        # Parse la tile map (y calculé une fois par ligne, cases vides écartées d'emblée)
+        for row_idx, row in enumerate(game_map):
+            y = row_idx * TILE_SIZE
+            for col_idx, map_code in enumerate(row):
                 if map_code == TILE_EMPTY:
                     continue
-                # Codes négatifs = background
-                is_background = map_code < 0
-                abs_code = abs(map_code)
-                # Tuiles rock
-                if abs_code == TILE_ROCK1:
-                    tile = Tile(x, y, self.tile_images["rock1"], is_solid=not is_background)
-                    if is_background:
-                        background_zone.add(tile)
-                    else:
-                        solid_zone.add(tile)
-                elif abs_code == TILE_ROCK2:
-                    tile = Tile(x, y, self.tile_images["rock2"], is_solid=not is_background)
-                    if is_background:
-                        background_zone.add(tile)
-                    else:
-                        solid_zone.add(tile)
-                elif abs_code == TILE_ROCK3:
-                    tile = Tile(x, y, self.tile_images["rock3"], is_solid=not is_background)
-                    if is_background:
-                        background_zone.add(tile)
-                    else:
-                        solid_zone.add(tile)
-                elif abs_code == TILE_ROCK4:
-                    tile = Tile(x, y, self.tile_images["rock4"], is_solid=not is_background)
-                    if is_background:
-                        background_zone.add(tile)
-                    else:
-                        solid_zone.add(tile)
-                elif abs_code == TILE_FLOOR:
-                    tile = Tile(x, y, self.tile_images["floor"], is_solid=not is_background)
-                    if is_background:
-                        background_zone.add(tile)
-                    else:
-                        solid_zone.add(tile)
-                elif abs_code == TILE_WALL:
-                    tile = Tile(x, y, self.tile_images["wall"], is_solid=not is_background)
-                    if is_background:
-                        background_zone.add(tile)
-                    else:
-                        solid_zone.add(tile)
-                elif map_code == TILE_BEAM:
-                    tile = Tile(x, y, self.tile_images["beam"], is_solid=False)
-                    background_zone.add(tile)
-                elif map_code == TILE_DOOR:
-                    tile = Tile(x, y, self.tile_images["door"], is_solid=False)
-                    background_zone.add(tile)
-                elif map_code == TILE_ROOM:
-                    tile = Tile(x, y, self.tile_images["room"], is_solid=False)
-                    background_zone.add(tile)
+                x = col_idx * TILE_SIZE
+                handler = get_handler(map_code)
+                if handler is not None:
+                    tile_type, zone = handler
+                    zone.add(Tile(x, y, tile_type=tile_type))
                 elif map_code == TILE_SPIKE:
                     # Spike au sol, hitbox réduite
-                    spike = Tile(x, y + 10, self.tile_images["spike"], is_solid=False)
+                    spike = Tile(x, y + 10, tile_type=spike_type)
                     spike.height = 22
                     hazard_zone.add(spike)
                     spikes.append(spike)
                 # Ennemis
-                elif map_code == TILE_METALL:
-                    metall = self.enemy_factory.create("metall", x, y)
-                    enemies.append(metall)
-                elif map_code == TILE_BLADER:
-                    blader = self.enemy_factory.create("blader", x, y)
-                    enemies.append(blader)
-                elif map_code == TILE_GUTSMAN:
-                    gutsman = self.enemy_factory.create("gutsman", x, y)
-                    enemies.append(gutsman)
+                elif map_code in enemy_codes:
+                    enemies.append(create_enemy(enemy_codes[map_code], x, y))
+        # Fusionne le décor statique en une seule surface
+        background_tiles = background_zone.get_children_copy()
+        if background_tiles:
+            for tile in background_tiles:
+                background_zone.remove(tile)
+            level_width = max(len(row) for row in game_map) * TILE_SIZE
+            level_height = len(game_map) * TILE_SIZE
+            background_zone.add(StaticBackground(background_tiles, level_width, level_height))
+            if Logger.enabled_for("COMPOSITE"):
+                Logger.log("COMPOSITE", f"{len(background_tiles)} background tiles pre-composited")
         # Assemble le niveau
         level.add(background_zone)
         level.add(solid_zone)
         level.add(hazard_zone)
-        Logger.log("COMPOSITE", f"Level {level_number} loaded: {len(enemies)} enemies, {len(spikes)} spikes, {len(level.get_all_solid_tiles())} solid tiles")
+        if Logger.enabled_for("COMPOSITE"):
+            Logger.log("COMPOSITE", f"Level {level_number} loaded: {len(enemies)} enemies, {len(spikes)} spikes, {len(level.get_all_solid_tiles())} solid tiles")
         return level, enemies, spikes
 
 # Test rapide
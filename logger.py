@@ -3,11 +3,30 @@ Système de logging pour tracer les événements du jeu.
 Utilisé pour démontrer l'utilisation des design patterns.
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 from datetime import datetime
 from pathlib import Path
 
 
+def _env_levels(variable: str) -> list:
+    """Lit une liste de catégories séparées par des virgules dans une variable d'environnement"""
+    return [level.strip().upper() for level in os.environ.get(variable, "").split(",") if level.strip()]
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler qui dépose l'enregistrement tel quel: la file reste dans le
+    même processus, le formatage est donc laissé au thread d'écriture.
+    """
+    
+    def prepare(self, record):
+        return record
+
+
 class Logger:
     """
     Classe de logging centralisée pour le projet.
@@ -24,21 +43,32 @@ class Logger:
     ERROR = "ERROR"
     INFO = "INFO"
     
+    # Catégories actives (une catégorie absente est considérée active).
+    # OBSERVER et STATE tracent à chaque événement / transition: coupés par défaut.
+    LEVELS_ENABLED = {
+        SINGLETON: True,
+        STATE: False,
+        DECORATOR: True,
+        FACTORY: True,
+        COMPOSITE: True,
+        OBSERVER: False,
+        ERROR: True,
+        INFO: True
+    }
+    # Surcharges par variables d'environnement, ex: MEGAMAN_LOG_ENABLE="OBSERVER,STATE"
+    LEVELS_ENABLED.update(dict.fromkeys(_env_levels("MEGAMAN_LOG_ENABLE"), True))
+    LEVELS_ENABLED.update(dict.fromkeys(_env_levels("MEGAMAN_LOG_DISABLE"), False))
+    
     _instance = None
-    _initialized = False
     
     def __new__(cls):
-        """Implémente un Singleton pour le logger"""
+        """Implémente un Singleton pour le logger, configuré une seule fois à la création"""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            instance = super().__new__(cls)
+            instance._setup_logger()
+            cls._instance = instance
         return cls._instance
     
-    def __init__(self):
-        """Initialise le logger une seule fois"""
-        if not Logger._initialized:
-            self._setup_logger()
-            Logger._initialized = True
-    
     def _setup_logger(self):
         """Configure le système de logging"""
         # Crée le logger
@@ -61,9 +91,27 @@ class Logger:
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(formatter)
         
-        # Ajoute les handlers
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Les écritures (fichier, console) sont faites par un thread dédié:
+        # l'appelant ne fait que déposer l'enregistrement dans une file
+        self._log_queue = queue.Queue(-1)
+        self.logger.addHandler(_DeferredQueueHandler(self._log_queue))
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        # Vide la file et ferme le fichier à la sortie du programme
+        atexit.register(self._listener.stop)
+    
+    @classmethod
+    def enabled_for(cls, level: str) -> bool:
+        """
+        Indique si une catégorie est active.
+        Permet d'éviter de construire le message quand il serait ignoré.
+        
+        Args:
+            level: Niveau de log (SINGLETON, STATE, DECORATOR, etc.)
+        """
+        return cls.LEVELS_ENABLED.get(level, True)
     
     @classmethod
     def log(cls, level: str, message: str):
@@ -74,21 +122,23 @@ class Logger:
             level: Niveau de log (SINGLETON, STATE, DECORATOR, etc.)
             message: Message à logger
         """
-        instance = cls()
-        formatted_message = f"[{level}] {message}"
-        instance.logger.info(formatted_message)
+        if not cls.LEVELS_ENABLED.get(level, True):
+            return
+        instance = cls._instance or cls()
+        # Formatage différé: construit seulement si un handler émet le message
+        instance.logger.info("[%s] %s", level, message)
     
     @classmethod
     def error(cls, message: str):
         """Log une erreur"""
-        instance = cls()
-        instance.logger.error(f"[ERROR] {message}")
+        instance = cls._instance or cls()
+        instance.logger.error("[ERROR] %s", message)
     
     @classmethod
     def info(cls, message: str):
         """Log une information"""
-        instance = cls()
-        instance.logger.info(f"[INFO] {message}")
+        instance = cls._instance or cls()
+        instance.logger.info("[INFO] %s", message)
 
 
 # Test du logger au démarrage
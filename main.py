@@ -26,6 +26,10 @@ from events import EventManager
 from events.observers import ScoreObserver, HealthObserver, SoundObserver, AchievementObserver, Observer
 from powerups.powerup_decorators import StrengthBoostDecorator
 
+# Codes de touches liés une fois au chargement du module (lus à chaque frame)
+_K_LEFT, _K_RIGHT, _K_a, _K_d, _K_ESCAPE, _K_RETURN, _K_KP_ENTER = (
+    pygame.K_LEFT, pygame.K_RIGHT, pygame.K_a, pygame.K_d, pygame.K_ESCAPE, pygame.K_RETURN, pygame.K_KP_ENTER)
+
 
 class LevelCompleteObserver(Observer):
     """Observateur pour la fin de niveau"""
@@ -103,14 +107,20 @@ class Game:
         map_index = (self.game_manager.current_level - 1) % len(tile_map.GAME_MAPS)
         current_map = tile_map.GAME_MAPS[map_index]
         self.level_width = len(current_map[0]) * TILE_SIZE
-        self.scroll_x = 0
+        # Caméra: position du bord gauche de l'écran dans le niveau (le monde ne bouge pas)
+        self.camera_x = 0
         
         # Liste d'objets collectables
         self.items = []
         
+        # Rectangles du HUD, calculés pour une vie maximale donnée (voir layout_health_bar)
+        self.hud_max_health = None
+        self.health_bar_bg = None
+        self.health_bar_fill = None
+        
         # Configure les observateurs (Observer Pattern)
         # Nettoie les anciens observateurs pour éviter les doublons
-        self.event_manager.listeners = {}
+        self.event_manager.clear()
         
         self.score_observer = ScoreObserver(self.game_manager)
         self.health_observer = HealthObserver(self.player)
@@ -154,74 +164,48 @@ class Game:
         keys = pygame.key.get_pressed()
         
         # Réinitialisation du jeu
-        if self.game_manager.game_over and (keys[pygame.K_RETURN] or keys[pygame.K_KP_ENTER]):
+        if self.game_manager.game_over and (keys[_K_RETURN] or keys[_K_KP_ENTER]):
             self.reset_game()
             return
         
         # Pause
-        if keys[pygame.K_ESCAPE]:
+        if keys[_K_ESCAPE]:
             self.game_manager.toggle_pause()
             pygame.time.wait(200)  # Évite la répétition
         
         # Délègue au joueur (State Pattern) et gère le scrolling
         if not self.game_manager.game_over and not self.game_manager.paused:
-            # Scrolling horizontal - déplace la map au lieu du joueur
-            if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                self.move_map_x(self.player.get_speed())
+            # Scrolling horizontal - la caméra suit le joueur, qui reste fixe à l'écran
+            if keys[_K_LEFT] or keys[_K_a]:
+                self.move_camera_x(-self.player.get_speed())
                 self.player.direction = "left"
             
-            if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                self.move_map_x(-self.player.get_speed())
+            if keys[_K_RIGHT] or keys[_K_d]:
+                self.move_camera_x(self.player.get_speed())
                 self.player.direction = "right"
             
             # Le reste des contrôles (saut, tir) est géré par le State Pattern
             self.player.handle_input(keys)
     
-    def move_map_x(self, velocity_x):
+    def move_camera_x(self, dx):
         """
-        Déplace tous les éléments de la map horizontalement (scrolling).
+        Fait défiler l'écran horizontalement: la caméra et le joueur avancent
+        ensemble, le reste du niveau garde ses coordonnées.
         
         Args:
-            velocity_x: Vélocité horizontale (positif = droite, négatif = gauche)
+            dx: Déplacement horizontal (positif = droite, négatif = gauche)
         """
         # Vérifie les limites du scrolling
-        # Si on va à droite (velocity_x < 0), on ne doit pas dépasser la fin du niveau
-        if velocity_x < 0 and abs(self.scroll_x) >= self.level_width - GAME_WIDTH:
+        # Si on va à droite, on ne doit pas dépasser la fin du niveau
+        if dx > 0 and self.camera_x >= self.level_width - GAME_WIDTH:
             return
             
-        # Si on va à gauche (velocity_x > 0), on ne doit pas dépasser le début (scroll_x = 0)
-        if velocity_x > 0 and self.scroll_x >= 0:
+        # Si on va à gauche, on ne doit pas dépasser le début (camera_x = 0)
+        if dx < 0 and self.camera_x <= 0:
             return
-            
-        self.scroll_x += velocity_x
-        
-        # Déplace les tuiles du niveau
-        for zone in self.level.get_children():
-            for component in zone.get_children():
-                component.x += velocity_x
         
-        # Déplace les spikes
-        for spike in self.spikes:
-            spike.x += velocity_x
-        
-        # Déplace les ennemis
-        for enemy in self.enemies:
-            enemy.x += velocity_x
-            # Ajuste la position de départ pour les ennemis mobiles
-            if hasattr(enemy, 'start_x'):
-                enemy.start_x += velocity_x
-            # Déplace les projectiles des ennemis
-            if hasattr(enemy, 'bullets'):
-                for bullet in enemy.bullets:
-                    bullet.x += velocity_x
-        
-        # Déplace les projectiles du joueur
-        for bullet in self.player.bullets:
-            bullet.x += velocity_x
-        
-        # Déplace les objets collectables
-        for item in self.items:
-            item.x += velocity_x
+        self.camera_x += dx
+        self.player.x += dx
     
     def update(self):
         """Met à jour la logique du jeu"""
@@ -233,91 +217,139 @@ class Game:
         if self.game_manager.game_over or self.game_manager.paused:
             return
         
+        # Temps courant, lu une seule fois par frame pour toutes les entités
+        now = pygame.time.get_ticks()
+        
+        # Références locales pour les boucles de la frame (pas de self. par entité)
+        player = self.player
+        camera_x = self.camera_x
+        enemies = self.enemies
+        items = self.items
+        # Les événements de la frame sont mis en file et notifiés ensemble en fin d'update
+        post = self.event_manager.post
+        
         # Met à jour le joueur
-        self.player.update()
+        player.update(camera_x, now)
         
         # Applique la gravité et vérifie les collisions
-        self.check_collisions()
+        self.check_collisions(now)
         
         # Met à jour les ennemis
-        for enemy in self.enemies:
-            enemy.update(self.player.x)
+        player_x = player.x
+        for enemy in enemies:
+            enemy.update(player_x, now, camera_x)
             
             # Collision joueur-ennemi
-            if not self.player.invincible and self.player.colliderect(enemy):
-                self.player.take_damage(1)
-                self.event_manager.notify_observers(EVENT_PLAYER_HIT, {"damage": 1})
+            if not player.invincible and player.colliderect(enemy):
+                player.take_damage(1)
+                post(EVENT_PLAYER_HIT, {"damage": 1})
             
-            # Collision projectiles joueur - ennemis
-            for bullet in self.player.bullets:
-                if bullet.colliderect(enemy) and not bullet.used:
+            # Collision projectiles ennemis - joueur (balayage AABB fait en C par collidelistall)
+            if enemy.bullets and not player.invincible:
+                bullets = enemy.bullets
+                for index in player.collidelistall(bullets):
+                    bullet = bullets[index]
+                    if not player.invincible and not bullet.used:
+                        bullet.used = True
+                        player.take_damage(2)
+                        post(EVENT_PLAYER_HIT, {"damage": 2})
+        
+        # Collision projectiles joueur - ennemis: un tir touche au plus un ennemi encore en vie
+        # (balayage AABB fait en C par collidelistall, seuls les ennemis touchés sont parcourus)
+        strength = player.get_strength()
+        drop_random_item = self.item_factory.drop_random_item
+        for bullet in player.bullets:
+            if bullet.used:
+                continue
+            for index in bullet.collidelistall(enemies):
+                enemy = enemies[index]
+                if enemy.health > 0:
                     bullet.used = True
-                    enemy.health -= self.player.get_strength()
+                    enemy.health -= strength
                     
                     if enemy.health <= 0:
                         # Ennemi vaincu
-                        self.event_manager.notify_observers(EVENT_ENEMY_DEFEATED, 
-                                                           {"enemy": enemy.__class__.__name__, 
-                                                            "points": ENEMY_KILL_SCORE})
+                        post(EVENT_ENEMY_DEFEATED,
+                             {"enemy": enemy.__class__.__name__,
+                              "points": ENEMY_KILL_SCORE})
                         # Drop d'objet (Factory Pattern)
-                        dropped_item = self.item_factory.drop_random_item(enemy.x, enemy.y)
+                        dropped_item = drop_random_item(enemy.x, enemy.y)
                         if dropped_item:
-                            self.items.append(dropped_item)
-            
-            # Collision projectiles ennemis - joueur
-            if hasattr(enemy, 'bullets'):
-                for bullet in enemy.bullets:
-                    if not self.player.invincible and self.player.colliderect(bullet) and not bullet.used:
-                        bullet.used = True
-                        self.player.take_damage(2)
-                        self.event_manager.notify_observers(EVENT_PLAYER_HIT, {"damage": 2})
+                            items.append(dropped_item)
+                    break
         
-        # Retire les ennemis vaincus
-        self.enemies = [e for e in self.enemies if e.health > 0]
+        # Retire en place les ennemis vaincus (ordre conservé, pas de nouvelle liste)
+        kept = 0
+        for enemy in enemies:
+            if enemy.health > 0:
+                enemies[kept] = enemy
+                kept += 1
+        del enemies[kept:]
         
         # Met à jour les objets
-        for item in self.items:
+        for item in items:
             item.update()
-            
-            # Collision joueur-objet
-            if self.player.colliderect(item) and not item.used:
+        
+        # Collision joueur-objet (seuls les objets touchés sont parcourus en Python)
+        for index in player.collidelistall(items):
+            item = items[index]
+            if not item.used:
                 item.used = True
                 
-                if item.item_type in ["life_energy", "big_life_energy"]:
-                    self.player.heal(item.value)
+                if item.item_type in ("life_energy", "big_life_energy"):
+                    player.heal(item.value)
                 
                 elif item.item_type == "strength_up":
-                    self.player.stats = StrengthBoostDecorator(self.player.stats)
+                    player.stats = StrengthBoostDecorator(player.stats)
                     Logger.log("INFO", "Player picked up Strength Boost!")
 
-                self.event_manager.notify_observers(EVENT_ITEM_COLLECTED, 
-                                                   {"type": item.item_type, 
-                                                    "heal": item.value if "energy" in item.item_type else 0})
-        
-        # Retire les objets collectés
-        self.items = [i for i in self.items if not i.used]
+                post(EVENT_ITEM_COLLECTED,
+                     {"type": item.item_type,
+                      "heal": item.value if "energy" in item.item_type else 0})
+        
+        # Retire en place les objets collectés et les rend à la factory pour réutilisation
+        release = self.item_factory.release
+        kept = 0
+        for item in items:
+            if item.used:
+                release(item)
+            else:
+                items[kept] = item
+                kept += 1
+        del items[kept:]
         
         # Collision avec les pièges
-        for spike in self.spikes:
-            if self.player.colliderect(spike):
-                self.player.health = 0
+        if player.collidelist(self.spikes) != -1:
+            player.health = 0
         
         # Vérifie la mort du joueur
-        if self.player.health <= 0 or self.player.y > GAME_HEIGHT:
+        if player.health <= 0 or player.y > GAME_HEIGHT:
             self.game_manager.set_game_over(True)
             
         # Vérifie la fin du niveau
         # Si on a scrollé jusqu'au bout et que le joueur est à droite de l'écran
-        if abs(self.scroll_x) >= self.level_width - GAME_WIDTH - TILE_SIZE:
+        if camera_x >= self.level_width - GAME_WIDTH - TILE_SIZE:
              # On laisse une marge d'une tuile
-             self.event_manager.notify_observers(EVENT_LEVEL_COMPLETE, {"level": self.game_manager.current_level})
+             post(EVENT_LEVEL_COMPLETE, {"level": self.game_manager.current_level})
+        
+        self.event_manager.flush()
     
-    def check_collisions(self):
-        """Vérifie les collisions avec les tuiles"""
-        solid_tiles = self.level.get_all_solid_tiles()
+    def check_collisions(self, now):
+        """
+        Vérifie les collisions avec les tuiles.
+        
+        Args:
+            now: Temps courant en ms, transmis aux ennemis qui atterrissent
+        """
+        # Seules les tuiles des cases couvertes par chaque acteur sont testées (grille du niveau),
+        # préfiltrées en C par collidelistall. Le test est refait avant chaque correction:
+        # la position de l'acteur a pu changer depuis le préfiltre.
+        tiles_near = self.level.tiles_near
         
         # Collision verticale (joueur)
-        for tile in solid_tiles:
+        tiles = tiles_near(self.player)
+        for index in self.player.collidelistall(tiles):
+            tile = tiles[index]
             if self.player.colliderect(tile):
                 if self.player.velocity_y > 0:  # Tombe
                     self.player.y = tile.y - self.player.height
@@ -328,18 +360,22 @@ class Game:
         
         # Collision pour les ennemis
         for enemy in self.enemies:
-            for tile in solid_tiles:
+            tiles = tiles_near(enemy)
+            for index in enemy.collidelistall(tiles):
+                tile = tiles[index]
                 if enemy.colliderect(tile):
                     if enemy.velocity_y > 0:
                         enemy.y = tile.y - enemy.height
-                        enemy.on_land()
+                        enemy.on_land(now)
                     elif enemy.velocity_y < 0:
                         enemy.y = tile.y + tile.height
                         enemy.velocity_y = 0
         
         # Collision pour les objets
         for item in self.items:
-            for tile in solid_tiles:
+            tiles = tiles_near(item)
+            for index in item.collidelistall(tiles):
+                tile = tiles[index]
                 if item.colliderect(tile) and item.velocity_y > 0:
                     item.y = tile.y - item.height
                     item.on_land()
@@ -354,61 +390,77 @@ class Game:
         if self.background:
             # Background 1 (Loin - lent)
             bg_width = self.background.get_width()
-            bg_x = (self.scroll_x * 0.2) % bg_width
+            bg_x = (-self.camera_x * 0.2) % bg_width
             self.game_manager.screen.blit(self.background, (bg_x - bg_width, 80))
             self.game_manager.screen.blit(self.background, (bg_x, 80))
             
             # Background 2 (Proche - plus rapide)
             if self.background2:
                 bg2_width = self.background2.get_width()
-                bg2_x = (self.scroll_x * 0.5) % bg2_width
+                bg2_x = (-self.camera_x * 0.5) % bg2_width
                 self.game_manager.screen.blit(self.background2, (bg2_x - bg2_width, 80))
                 self.game_manager.screen.blit(self.background2, (bg2_x, 80))
         
         # Niveau (Composite Pattern)
-        self.level.render(self.game_manager.screen)
+        self.level.render(self.game_manager.screen, self.camera_x)
         
         # Joueur
-        self.player.draw(self.game_manager.screen)
+        self.player.draw(self.game_manager.screen, self.camera_x)
         
         # Ennemis
         for enemy in self.enemies:
-            enemy.draw(self.game_manager.screen)
+            enemy.draw(self.game_manager.screen, self.camera_x)
         
-        # Objets
-        for item in self.items:
-            item.draw(self.game_manager.screen)
+        # Objets (un seul appel blits pour tous)
+        if self.items:
+            camera_x = self.camera_x
+            self.game_manager.screen.blits([(item.image, (item.x - camera_x, item.y)) for item in self.items],
+                                           doreturn=False)
         
         # HUD - Barre de vie
-        health_bar_bg = pygame.Rect(HEALTH_BAR_X, HEALTH_BAR_Y, 
-                                    HEALTH_WIDTH, HEALTH_HEIGHT * self.player.get_max_health())
-        pygame.draw.rect(self.game_manager.screen, COLOR_BLACK, health_bar_bg)
+        max_health = self.player.get_max_health()
+        if max_health != self.hud_max_health:
+            self.layout_health_bar(max_health)
+        pygame.draw.rect(self.game_manager.screen, COLOR_BLACK, self.health_bar_bg)
         
-        for i in range(self.player.health):
-            health_rect = pygame.Rect(HEALTH_BAR_X, 
-                                      HEALTH_BAR_Y + (self.player.get_max_health() - i - 1) * HEALTH_HEIGHT,
-                                      HEALTH_WIDTH, HEALTH_HEIGHT)
-            pygame.draw.rect(self.game_manager.screen, COLOR_WHITE, health_rect)
+        # Les segments de vie sont empilés depuis le bas: un seul rectangle les couvre tous
+        if self.player.health > 0:
+            pygame.draw.rect(self.game_manager.screen, COLOR_WHITE, self.health_bar_fill[self.player.health])
         
         # HUD - Score
         score_text = self.game_manager.get_formatted_score()
-        score_surface = self.game_manager.font.render(score_text, False, COLOR_WHITE)
+        score_surface = self.game_manager.render_text(score_text)
         self.game_manager.screen.blit(score_surface, (GAME_WIDTH // 2, TILE_SIZE // 2))
         
         # Game Over
         if self.game_manager.game_over:
-            game_over_text = self.game_manager.font.render("Game Over!", False, COLOR_WHITE)
-            restart_text = self.game_manager.font.render("Press [Enter] to Restart", False, COLOR_WHITE)
+            game_over_text = self.game_manager.render_text("Game Over!")
+            restart_text = self.game_manager.render_text("Press [Enter] to Restart")
             
             self.game_manager.screen.blit(game_over_text, (GAME_WIDTH // 8, GAME_HEIGHT // 2))
             self.game_manager.screen.blit(restart_text, (GAME_WIDTH // 8, GAME_HEIGHT // 2 + TILE_SIZE))
         
         # Pause
         if self.game_manager.paused and not self.game_manager.game_over:
-            pause_text = self.game_manager.font.render("PAUSED", False, COLOR_WHITE)
+            pause_text = self.game_manager.render_text("PAUSED")
             self.game_manager.screen.blit(pause_text, (GAME_WIDTH // 2 - 60, GAME_HEIGHT // 2))
         
-        pygame.display.update()
+        pygame.display.flip()
+    
+    def layout_health_bar(self, max_health):
+        """
+        Calcule une fois les rectangles de la barre de vie pour une vie maximale donnée.
+        
+        Args:
+            max_health: Vie maximale du joueur (peut changer avec les power-ups)
+        """
+        self.hud_max_health = max_health
+        self.health_bar_bg = pygame.Rect(HEALTH_BAR_X, HEALTH_BAR_Y,
+                                         HEALTH_WIDTH, HEALTH_HEIGHT * max_health)
+        # health_bar_fill[vie]: zone blanche pour cette vie (segments du bas)
+        self.health_bar_fill = [pygame.Rect(HEALTH_BAR_X, HEALTH_BAR_Y + (max_health - health) * HEALTH_HEIGHT,
+                                            HEALTH_WIDTH, HEALTH_HEIGHT * health)
+                                for health in range(max_health + 1)]
     
     def show_start_screen(self):
         """Affiche l'écran de démarrage"""
@@ -428,10 +480,10 @@ class Game:
                 self.game_manager.screen.blit(self.background, (0, 80))
                 
             # Titre (Ombré)
-            title_text = self.game_manager.font.render("MEGAMAN", True, COLOR_WHITE)
-            title_shadow = self.game_manager.font.render("MEGAMAN", True, COLOR_BLACK)
+            title_text = self.game_manager.render_text("MEGAMAN", COLOR_WHITE, True)
+            title_shadow = self.game_manager.render_text("MEGAMAN", COLOR_BLACK, True)
             
-            start_text = self.game_manager.font.render("Press any key to start", True, COLOR_WHITE)
+            start_text = self.game_manager.render_text("Press any key to start", COLOR_WHITE, True)
             
             self.game_manager.screen.blit(title_shadow, (GAME_WIDTH//2 - title_text.get_width()//2 + 2, GAME_HEIGHT//3 + 2))
             self.game_manager.screen.blit(title_text, (GAME_WIDTH//2 - title_text.get_width()//2, GAME_HEIGHT//3))
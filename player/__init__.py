@@ -8,7 +8,13 @@ from player.player_states import (
     JumpingState,
     ShootingState,
     RunningShootingState,
-    JumpShootingState
+    JumpShootingState,
+    IDLE,
+    RUNNING,
+    JUMPING,
+    SHOOTING,
+    RUNNING_SHOOTING,
+    JUMP_SHOOTING
 )
 
 __all__ = [
@@ -21,5 +27,11 @@ __all__ = [
     'JumpingState',
     'ShootingState',
     'RunningShootingState',
-    'JumpShootingState'
+    'JumpShootingState',
+    'IDLE',
+    'RUNNING',
+    'JUMPING',
+    'SHOOTING',
+    'RUNNING_SHOOTING',
+    'JUMP_SHOOTING'
 ]
@@ -4,8 +4,7 @@ Joueur Megaman (State Pattern)
 
 import pygame
 import os
-from player.player_states import IdleState, PlayerState
-from powerups.powerup_decorators import Character
+from player.player_states import IDLE, PlayerState, read_input_bits
 from logger import Logger
 from config import *
 
@@ -15,6 +14,8 @@ class Bullet(pygame.Rect):
     Projectile du joueur.
     """
     
+    __slots__ = ("direction", "velocity_x", "image", "used")
+    
     def __init__(self, x, y, direction, image):
         """
         Args:
@@ -28,31 +29,60 @@ class Bullet(pygame.Rect):
         self.image = image
         self.used = False
     
+    def reset(self, x, y, direction):
+        """Réinitialise un projectile recyclé depuis le pool"""
+        self.x = x
+        self.y = y
+        self.direction = direction
+        self.velocity_x = -PLAYER_BULLET_VELOCITY_X if direction == "left" else PLAYER_BULLET_VELOCITY_X
+        self.used = False
+    
     def update(self):
         self.x += self.velocity_x
 
 
-class PlayerStats(Character):
+class PlayerStats:
     """
-    Stats du joueur, décorables.
+    Stats du joueur, décorables (interface Character des power-ups).
+    Les valeurs de base sont en lecture seule: les décorateurs composent leurs
+    stats à la pose, une base modifiée ensuite ne leur parviendrait pas.
     """
+    
+    __slots__ = ("_base_speed", "_base_strength", "_base_defense", "_max_health")
+    
     def __init__(self):
-        self.base_speed = PLAYER_VELOCITY_X
-        self.base_strength = 1
-        self.base_defense = 0
-        self.max_health = PLAYER_MAX_HEALTH
+        self._base_speed = PLAYER_VELOCITY_X
+        self._base_strength = 1
+        self._base_defense = 0
+        self._max_health = PLAYER_MAX_HEALTH
+    
+    @property
+    def base_speed(self) -> int:
+        return self._base_speed
+    
+    @property
+    def base_strength(self) -> int:
+        return self._base_strength
+    
+    @property
+    def base_defense(self) -> int:
+        return self._base_defense
+    
+    @property
+    def max_health(self) -> int:
+        return self._max_health
         
     def get_speed(self) -> int:
-        return self.base_speed
+        return self._base_speed
     
     def get_strength(self) -> int:
-        return self.base_strength
+        return self._base_strength
         
     def get_defense(self) -> int:
-        return self.base_defense
+        return self._base_defense
         
     def get_max_health(self) -> int:
-        return self.max_health
+        return self._max_health
 
 
 class Player(pygame.Rect):
@@ -71,24 +101,47 @@ class Player(pygame.Rect):
         # Images
         self.images = images
         
+        # Temps courant (ms), lu une fois par frame et partagé avec les états
+        self.tick = pygame.time.get_ticks()
+        # Masque des actions demandées (LEFT_BIT, ...), lu une fois par frame
+        self.input_bits = 0
+        
+        # Minuteries des états (partagés): début du tir, frame d'animation de course
+        self.shoot_time = 0
+        self.anim_index = 0
+        self.anim_last_update = 0
+        
+        # Direction (la modifier rafraîchit les images courantes, voir refresh_frames)
+        self._direction = "right"
+        # Images de l'état et de la direction courants, choisies hors de la boucle de dessin
+        self.active_frames = None
+        self.current_image = None
+        
         # État actuel (State Pattern)
-        self.state: PlayerState = IdleState()
+        self.state = None
+        self.set_state(IDLE)
         Logger.log("STATE", "Player initialized in IdleState")
         
         # Physique
         self.velocity_x = 0
         self.velocity_y = 0
-        self.direction = "right"
         self.jumping = False
         
         # Santé et invincibilité
         self.health = PLAYER_MAX_HEALTH
         self.invincible = False
-        self.invincible_start = 0
+        # Échéances absolues (ms): comparées directement à l'horloge
+        self.invincible_until = 0
+        # Clignotement pendant l'invincibilité: le sprite est-il affiché cette frame ?
+        self.blink_visible = True
         
         # Projectiles
         self.bullets = []
-        self.last_shot = 0
+        # Projectiles morts réutilisés par shoot() au lieu d'en allouer de nouveaux,
+        # préalloués pour le nombre maximal de tirs à l'écran
+        self._bullet_pool = [Bullet(0, 0, "right", images["bullet"]) for _ in range(PLAYER_MAX_BULLETS)]
+        # Premier tir possible après un cooldown complet, comme si un tir avait eu lieu à t=0
+        self.next_shot_time = PLAYER_SHOOT_COOLDOWN
         
         # Statistiques
         self.score = 0
@@ -111,20 +164,64 @@ class Player(pygame.Rect):
     def set_state(self, new_state: PlayerState):
         """
         Change l'état du joueur.
+        Les méthodes de l'état sont liées ici, une fois par transition, plutôt
+        qu'à chaque appel dans la boucle de jeu.
+        La transition est tracée ici, une fois pour tous les états, et le message
+        n'est construit que si la catégorie STATE est active.
+        """
+        previous = self.state
+        if previous is not None and Logger.enabled_for("STATE"):
+            Logger.log("STATE", f"Player: {previous.name} -> {new_state.name}")
+        self.state: PlayerState = new_state
+        new_state.enter(self)
+        self._state_step = new_state.step
+        self.refresh_frames()
+    
+    @property
+    def direction(self) -> str:
+        return self._direction
+    
+    @direction.setter
+    def direction(self, value: str):
+        if value != self._direction:
+            self._direction = value
+            self.refresh_frames()
+    
+    def refresh_frames(self):
         """
-        self.state = new_state
+        Choisit les images de l'état et de la direction courants.
+        Appelé au changement d'état ou de direction seulement: le dessin ne fait
+        plus de recherche dans le dictionnaire d'images.
+        """
+        state = self.state
+        frames = self.images[state.image_key][self._direction]
+        if state.animated:
+            self.active_frames = frames
+            self.current_image = frames[self.anim_index]
+        else:
+            self.active_frames = None
+            self.current_image = frames
     
     def handle_input(self, keys):
         """
-        Délègue à l'état courant.
+        Lit les entrées de la frame.
+        Le clavier est réduit une fois en masque d'actions, que les états testent avec &;
+        l'état courant le traite dans update (un seul appel par frame, voir PlayerState.step).
         """
-        self.state.handle_input(self, keys)
+        self.input_bits = read_input_bits(keys)
     
-    def update(self):
+    def update(self, camera_x=0, now=None):
         """
         Met à jour le joueur.
+        
+        Args:
+            camera_x: Bord gauche de l'écran dans le monde (les tirs sortis de l'écran disparaissent)
+            now: Temps courant en ms, lu une fois par frame (sinon lu ici)
         """
-        self.state.update(self)
+        if now is None:
+            now = pygame.time.get_ticks()
+        self.tick = now
+        self._state_step(self, self.input_bits)
         
         # Applique la gravité
         self.velocity_y += GRAVITY
@@ -134,29 +231,40 @@ class Player(pygame.Rect):
         
         # Gère l'invincibilité
         if self.invincible:
-            now = pygame.time.get_ticks()
-            if now - self.invincible_start > INVINCIBILITY_DURATION:
+            if now > self.invincible_until:
                 self.invincible = False
+                self.blink_visible = True
                 Logger.log("INFO", "Invincibility ended")
-        
-        # Met à jour les projectiles
-        for bullet in self.bullets:
-            bullet.update()
-        
-        # Retire les projectiles hors écran ou utilisés
-        self.bullets = [b for b in self.bullets if not b.used and 0 < b.x < GAME_WIDTH]
+            else:
+                self.blink_visible = (now // 100) % 2 == 0  # Clignote toutes les 100ms
+        
+        # Met à jour les projectiles, retire en place ceux utilisés ou hors écran
+        # et les rend au pool
+        bullets = self.bullets
+        recycle = self._bullet_pool.append
+        screen_right = camera_x + GAME_WIDTH
+        kept = 0
+        for bullet in bullets:
+            x = bullet.x + bullet.velocity_x
+            bullet.x = x
+            if not bullet.used and camera_x < x < screen_right:
+                bullets[kept] = bullet
+                kept += 1
+            else:
+                recycle(bullet)
+        del bullets[kept:]
     
     def shoot(self):
         """
         Tire un projectile.
         """
-        now = pygame.time.get_ticks()
+        now = self.tick
         
         # Vérifie le cooldown
-        if now - self.last_shot < PLAYER_SHOOT_COOLDOWN:
+        if now < self.next_shot_time:
             return
         
-        self.last_shot = now
+        self.next_shot_time = now + PLAYER_SHOOT_COOLDOWN
         
         # Crée le projectile
         if self.direction == "left":
@@ -164,11 +272,17 @@ class Player(pygame.Rect):
         else:
             x = self.x + self.width
         
-        y = self.y + TILE_SIZE / 2
+        y = self.y + PLAYER_BULLET_SPAWN_OFFSET_Y
         
-        bullet = Bullet(x, y, self.direction, self.images["bullet"])
+        pool = self._bullet_pool
+        if pool:
+            bullet = pool.pop()
+            bullet.reset(x, y, self.direction)
+        else:
+            bullet = Bullet(x, y, self.direction, self.images["bullet"])
         self.bullets.append(bullet)
-        Logger.log("INFO", f"Player shot bullet in direction {self.direction}")
+        if Logger.enabled_for("INFO"):
+            Logger.log("INFO", f"Player shot bullet in direction {self.direction}")
     
     def take_damage(self, damage: int):
         """
@@ -186,7 +300,8 @@ class Player(pygame.Rect):
         self.health -= actual_damage
         self.health = max(0, self.health)
         
-        Logger.log("INFO", f"Player took {damage} damage (health: {self.health}/{self.get_max_health()})")
+        if Logger.enabled_for("INFO"):
+            Logger.log("INFO", f"Player took {damage} damage (health: {self.health}/{self.get_max_health()})")
         
         if self.health > 0:
             self.set_invincible()
@@ -203,12 +318,15 @@ class Player(pygame.Rect):
         actual_heal = self.health - old_health
         
         if actual_heal > 0:
-            Logger.log("INFO", f"Player healed {actual_heal} HP (health: {self.health}/{self.get_max_health()})")
+            if Logger.enabled_for("INFO"):
+                Logger.log("INFO", f"Player healed {actual_heal} HP (health: {self.health}/{self.get_max_health()})")
     
     def set_invincible(self):
         """Active l'invincibilité temporaire"""
         self.invincible = True
-        self.invincible_start = pygame.time.get_ticks()
+        now = self.tick
+        self.invincible_until = now + INVINCIBILITY_DURATION
+        self.blink_visible = (now // 100) % 2 == 0
         Logger.log("INFO", "Player is now invincible")
     
     def on_land(self):
@@ -216,46 +334,61 @@ class Player(pygame.Rect):
         self.jumping = False
         self.velocity_y = 0
     
-    def draw(self, screen):
+    def draw(self, screen, camera_x=0):
         """
         Dessine le joueur à l'écran.
         
         Args:
             screen: Surface Pygame
+            camera_x: Bord gauche de l'écran dans le monde
         """
-        # Obtient l'image de l'état actuel
-        image = self.state.get_image(self)
-        
-        # Effet de clignotement si invincible
-        if self.invincible:
-            if (pygame.time.get_ticks() // 100) % 2 == 0:  # Clignote toutes les 100ms
-                screen.blit(image, self)
-        else:
-            screen.blit(image, self)
-        
-        # Dessine les projectiles
-        for bullet in self.bullets:
-            screen.blit(bullet.image, bullet)
+        # Effet de clignotement si invincible (phase calculée par update)
+        if self.blink_visible:
+            screen.blit(self.current_image, (self.x - camera_x, self.y))
+        
+        # Dessine les projectiles (un seul appel blits pour tous)
+        if self.bullets:
+            screen.blits([(bullet.image, (bullet.x - camera_x, bullet.y)) for bullet in self.bullets],
+                         doreturn=False)
+
+
+# Images du joueur déjà chargées (et converties), partagées par tous les appels
+_player_images = None
 
 
 def load_player_images():
     """
     Charge toutes les images du joueur.
+    Les images sont converties au format de l'écran: le mode vidéo doit déjà
+    être créé (GameManager.initialize_pygame). Le résultat est alors gardé en
+    cache et les appels suivants ne relisent pas le disque.
     
     Returns:
         dict: Dictionnaire d'images organisé par état
     """
+    global _player_images
+    if _player_images is not None:
+        return _player_images
+    
     def load_image(name, size):
         """Charge une image"""
         try:
             img = pygame.image.load(os.path.join(ASSETS_DIR, name))
-            return pygame.transform.scale(img, size)
+            img = pygame.transform.scale(img, size)
         except:
             Logger.error(f"Could not load image: {name}")
             # Retourne un surface vide en cas d'erreur
             surf = pygame.Surface(size)
             surf.fill((255, 0, 255))  # Magenta pour indiquer l'erreur
-            return surf
+            try:
+                return surf.convert()
+            except pygame.error:
+                return surf
+        # Format de l'écran une fois pour toutes (nécessite un mode vidéo)
+        try:
+            return img.convert_alpha()
+        except pygame.error:
+            return img
     
     images = {
         "idle": {
@@ -290,4 +423,7 @@ def load_player_images():
     }
     
     Logger.log("INFO", "Player images loaded successfully")
+    # Sans mode vidéo (tests), les images ne sont pas converties: pas de cache
+    if pygame.display.get_surface() is not None:
+        _player_images = images
     return images
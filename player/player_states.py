@@ -3,17 +3,58 @@
 """
 
 import pygame
-from logger import Logger
 from config import *
 
+# Codes de touches liés une fois au chargement du module (lus à chaque frame)
+_K_LEFT, _K_RIGHT, _K_UP, _K_a, _K_d, _K_w, _K_SPACE, _K_x = (
+    pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_SPACE, pygame.K_x)
+
+# Actions du joueur, regroupées en un masque de bits lu une fois par frame
+LEFT_BIT = 1
+RIGHT_BIT = 2
+JUMP_BIT = 4
+SHOOT_BIT = 8
+MOVE_BITS = LEFT_BIT | RIGHT_BIT
+
+
+def read_input_bits(keys) -> int:
+    """
+    Convertit l'état du clavier en masque d'actions (LEFT_BIT, RIGHT_BIT, JUMP_BIT, SHOOT_BIT).
+    
+    Args:
+        keys: Résultat de pygame.key.get_pressed()
+    """
+    bits = 0
+    if keys[_K_LEFT] or keys[_K_a]:
+        bits |= LEFT_BIT
+    if keys[_K_RIGHT] or keys[_K_d]:
+        bits |= RIGHT_BIT
+    if keys[_K_UP] or keys[_K_w]:
+        bits |= JUMP_BIT
+    if keys[_K_SPACE] or keys[_K_x]:
+        bits |= SHOOT_BIT
+    return bits
+
 
 class PlayerState:
     """
     Interface pour les états du joueur.
     """
-    def handle_input(self, player, keys):
+    # Instances uniques et sans données propres: pas de __dict__
+    __slots__ = ()
+    # Nom de l'état dans les traces de transition (Player.set_state)
+    name = None
+    # Clé des images de l'état dans player.images, et liste de frames à animer ou image fixe
+    image_key = None
+    animated = False
+
+    def handle_input(self, player, bits):
         """
         Gère les entrées utilisateur.
+        
+        Args:
+            player: Joueur
+            bits: Masque des actions demandées cette frame (voir read_input_bits)
         """
         raise NotImplementedError("State must implement handle_input")
 
@@ -26,178 +67,210 @@ class PlayerState:
     def get_image(self, player):
         """
         Retourne l'image pour cet état.
+        L'image courante est choisie par le joueur au changement d'état ou de direction
+        (Player.refresh_frames), puis avancée par les états animés.
+        """
+        return player.current_image
+
+    def step(self, player, bits):
         """
-        raise NotImplementedError("State must implement get_image")
+        Traite les entrées puis met à jour l'état: un seul appel par frame depuis Player.update.
+        Si les entrées changent d'état, c'est le nouvel état qui est mis à jour.
+        
+        Args:
+            player: Joueur
+            bits: Masque des actions demandées cette frame
+        """
+        self.handle_input(player, bits)
+        player.state.update(player)
+
+    def enter(self, player):
+        """
+        Appelé par Player.set_state à l'entrée dans l'état.
+        Les états sont partagés (IDLE, RUNNING, ...): leurs minuteries vivent sur le joueur.
+        """
+        pass
 
 
 class IdleState(PlayerState):
     """
     Joueur immobile.
     """
-    def handle_input(self, player, keys):
-        from player.player import Player  # Import local pour éviter boucle
+    __slots__ = ()
+    name = "IDLE"
+    image_key = "idle"
+    def handle_input(self, player, bits):
         # Saut
-        if (keys[pygame.K_UP] or keys[pygame.K_w]) and not player.jumping:
-            Logger.log("STATE", "Player: IDLE -> JUMPING")
-            player.set_state(JumpingState())
+        if bits & JUMP_BIT and not player.jumping:
+            player.set_state(JUMPING)
             player.velocity_y = PLAYER_VELOCITY_Y
             player.jumping = True
             return
         # Gauche
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            Logger.log("STATE", "Player: IDLE -> RUNNING")
-            player.set_state(RunningState())
+        if bits & LEFT_BIT:
+            player.set_state(RUNNING)
             player.direction = "left"
             return
         # Droite
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            Logger.log("STATE", "Player: IDLE -> RUNNING")
-            player.set_state(RunningState())
+        if bits & RIGHT_BIT:
+            player.set_state(RUNNING)
             player.direction = "right"
             return
         # Tir
-        if keys[pygame.K_SPACE] or keys[pygame.K_x]:
-            Logger.log("STATE", "Player: IDLE -> SHOOTING")
-            player.set_state(ShootingState())
+        if bits & SHOOT_BIT:
+            player.set_state(SHOOTING)
             player.shoot()
             return
     def update(self, player):
         player.velocity_x = 0
-    def get_image(self, player):
-        return player.images["idle"][player.direction]
+    def step(self, player, bits):
+        # Aucune action: reste immobile sans passer par handle_input
+        if not bits:
+            player.velocity_x = 0
+            return
+        PlayerState.step(self, player, bits)
 
 
 class RunningState(PlayerState):
     """
     Joueur court.
     """
-    def __init__(self):
-        self.animation_index = 0
-        self.last_update = pygame.time.get_ticks()
-    def handle_input(self, player, keys):
+    __slots__ = ()
+    name = "RUNNING"
+    image_key = "walk"
+    animated = True
+    def enter(self, player):
+        player.anim_index = 0
+        player.anim_last_update = player.tick
+    def handle_input(self, player, bits):
         # Saut
-        if (keys[pygame.K_UP] or keys[pygame.K_w]) and not player.jumping:
-            Logger.log("STATE", "Player: RUNNING -> JUMPING")
-            player.set_state(JumpingState())
+        if bits & JUMP_BIT and not player.jumping:
+            player.set_state(JUMPING)
             player.velocity_y = PLAYER_VELOCITY_Y
             player.jumping = True
             return
         # Tir en courant
-        if keys[pygame.K_SPACE] or keys[pygame.K_x]:
-            Logger.log("STATE", "Player: RUNNING -> RUNNING_SHOOTING")
-            player.set_state(RunningShootingState())
+        if bits & SHOOT_BIT:
+            player.set_state(RUNNING_SHOOTING)
             player.shoot()
             return
         # Arrêt
-        if not (keys[pygame.K_LEFT] or keys[pygame.K_a] or keys[pygame.K_RIGHT] or keys[pygame.K_d]):
-            Logger.log("STATE", "Player: RUNNING -> IDLE")
-            player.set_state(IdleState())
+        if not bits & MOVE_BITS:
+            player.set_state(IDLE)
             return
             player.velocity_x = player.get_speed()
     def update(self, player):
-        now = pygame.time.get_ticks()
-        if now - self.last_update > PLAYER_ANIMATION_SPEED:
-            self.last_update = now
-            self.animation_index = (self.animation_index + 1) % len(player.images["walk"][player.direction])
-    def get_image(self, player):
-        return player.images["walk"][player.direction][self.animation_index]
+        now = player.tick
+        if now - player.anim_last_update > PLAYER_ANIMATION_SPEED:
+            player.anim_last_update = now
+            frames = player.active_frames
+            player.anim_index = index = (player.anim_index + 1) % len(frames)
+            player.current_image = frames[index]
+    def step(self, player, bits):
+        # Course sans saut ni tir: pas de transition possible, seule l'animation avance
+        if bits & MOVE_BITS and not bits & (JUMP_BIT | SHOOT_BIT):
+            self.update(player)
+            return
+        PlayerState.step(self, player, bits)
 
 
 class JumpingState(PlayerState):
     """
     Joueur saute.
     """
-    def handle_input(self, player, keys):
+    __slots__ = ()
+    name = "JUMPING"
+    image_key = "jump"
+    def handle_input(self, player, bits):
         # Tir en sautant
-        if keys[pygame.K_SPACE] or keys[pygame.K_x]:
-            Logger.log("STATE", "Player: JUMPING -> JUMP_SHOOTING")
-            player.set_state(JumpShootingState())
+        if bits & SHOOT_BIT:
+            player.set_state(JUMP_SHOOTING)
             player.shoot()
             return
     def update(self, player):
         # Atterrissage géré par collision
         if not player.jumping:
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_LEFT] or keys[pygame.K_a] or keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                Logger.log("STATE", "Player: JUMPING -> RUNNING")
-                player.set_state(RunningState())
+            if player.input_bits & MOVE_BITS:
+                player.set_state(RUNNING)
             else:
-                Logger.log("STATE", "Player: JUMPING -> IDLE")
-                player.set_state(RunningState())
-    def get_image(self, player):
-        return player.images["jump"][player.direction]
+                player.set_state(IDLE)
 
 
 class ShootingState(PlayerState):
     """
     Joueur tire (immobile).
     """
-    def __init__(self):
-        self.shoot_time = pygame.time.get_ticks()
-        self.duration = PLAYER_SHOOT_COOLDOWN
-    def handle_input(self, player, keys):
+    __slots__ = ()
+    name = "SHOOTING"
+    image_key = "shoot"
+    def enter(self, player):
+        player.shoot_time = player.tick
+    def handle_input(self, player, bits):
         # Retour à Idle après le cooldown
-        now = pygame.time.get_ticks()
-        if now - self.shoot_time > self.duration:
-            Logger.log("STATE", "Player: SHOOTING -> IDLE")
-            player.set_state(IdleState())
+        now = player.tick
+        if now - player.shoot_time > PLAYER_SHOOT_COOLDOWN:
+            player.set_state(IDLE)
     def update(self, player):
         player.velocity_x = 0
-    def get_image(self, player):
-        return player.images["shoot"][player.direction]
 
 
 class RunningShootingState(PlayerState):
     """
     Joueur tire en courant.
     """
-    def __init__(self):
-        self.shoot_time = pygame.time.get_ticks()
-        self.duration = PLAYER_SHOOT_COOLDOWN
-        self.animation_index = 0
-        self.last_update = pygame.time.get_ticks()
-    def handle_input(self, player, keys):
-        now = pygame.time.get_ticks()
+    __slots__ = ()
+    name = "RUNNING_SHOOTING"
+    image_key = "walk_shoot"
+    animated = True
+    def enter(self, player):
+        player.shoot_time = player.tick
+        player.anim_index = 0
+        player.anim_last_update = player.tick
+    def handle_input(self, player, bits):
+        now = player.tick
         # Retour à Running après le cooldown
-        if now - self.shoot_time > self.duration:
-            if keys[pygame.K_LEFT] or keys[pygame.K_a] or keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                Logger.log("STATE", "Player: RUNNING_SHOOTING -> RUNNING")
-                player.set_state(RunningState())
+        if now - player.shoot_time > PLAYER_SHOOT_COOLDOWN:
+            if bits & MOVE_BITS:
+                player.set_state(RUNNING)
             else:
-                Logger.log("STATE", "Player: RUNNING_SHOOTING -> IDLE")
-                player.set_state(IdleState())
+                player.set_state(IDLE)
             return
     def update(self, player):
-        now = pygame.time.get_ticks()
-        if now - self.last_update > PLAYER_ANIMATION_SPEED:
-            self.last_update = now
-            self.animation_index = (self.animation_index + 1) % len(player.images["walk_shoot"][player.direction])
-    def get_image(self, player):
-        return player.images["walk_shoot"][player.direction][self.animation_index]
+        now = player.tick
+        if now - player.anim_last_update > PLAYER_ANIMATION_SPEED:
+            player.anim_last_update = now
+            frames = player.active_frames
+            player.anim_index = index = (player.anim_index + 1) % len(frames)
+            player.current_image = frames[index]
 
 
 class JumpShootingState(PlayerState):
     """
     Joueur tire en sautant.
     """
-    def __init__(self):
-        self.shoot_time = pygame.time.get_ticks()
-        self.duration = PLAYER_SHOOT_COOLDOWN
-    def handle_input(self, player, keys):
+    __slots__ = ()
+    name = "JUMP_SHOOTING"
+    image_key = "jump_shoot"
+    def enter(self, player):
+        player.shoot_time = player.tick
+    def handle_input(self, player, bits):
         # Retour à Jumping après le cooldown
-        now = pygame.time.get_ticks()
-        if now - self.shoot_time > self.duration:
-            Logger.log("STATE", "Player: JUMP_SHOOTING -> JUMPING")
-            player.set_state(JumpingState())
+        now = player.tick
+        if now - player.shoot_time > PLAYER_SHOOT_COOLDOWN:
+            player.set_state(JUMPING)
     def update(self, player):
         # Vérifie l'atterrissage
         if not player.jumping:
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_LEFT] or keys[pygame.K_a] or keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                Logger.log("STATE", "Player: JUMP_SHOOTING -> RUNNING")
-                player.set_state(RunningState())
+            if player.input_bits & MOVE_BITS:
+                player.set_state(RUNNING)
             else:
-                Logger.log("STATE", "Player: JUMP_SHOOTING -> IDLE")
-                player.set_state(RunningState())
-    def get_image(self, player):
-        return player.images["jump_shoot"][player.direction]
+                player.set_state(IDLE)
+
+
+# Instances uniques: les états ne portent aucune donnée propre, les transitions n'allouent rien
+IDLE = IdleState()
+RUNNING = RunningState()
+JUMPING = JumpingState()
+SHOOTING = ShootingState()
+RUNNING_SHOOTING = RunningShootingState()
+JUMP_SHOOTING = JumpShootingState()
@@ -8,7 +8,8 @@ from powerups.powerup_decorators import (
     StrengthBoostDecorator,
     DefenseBoostDecorator,
     HealthBoostDecorator,
-    MultiShotDecorator
+    MultiShotDecorator,
+    apply_stack
 )
 
 __all__ = [
@@ -19,5 +20,6 @@ __all__ = [
     'StrengthBoostDecorator',
     'DefenseBoostDecorator',
     'HealthBoostDecorator',
-    'MultiShotDecorator'
+    'MultiShotDecorator',
+    'apply_stack'
 ]
@@ -3,38 +3,43 @@ Decorator Pattern - Système de power-ups
 Permet d'ajouter dynamiquement des capacités au joueur.
 """
 
+from typing import Protocol
 from logger import Logger
 from config import *
 
 
-class Character:
+class Character(Protocol):
     """
     Interface Component pour le Decorator Pattern.
     Définit les méthodes que tous les personnages doivent avoir.
+    Interface structurelle: les composants n'en héritent pas, il leur suffit
+    de fournir ces méthodes (leur MRO reste réduite à object).
     """
     
     def get_speed(self) -> int:
         """Retourne la vitesse du personnage"""
-        raise NotImplementedError
+        ...
     
     def get_strength(self) -> int:
         """Retourne la force (dégâts) du personnage"""
-        raise NotImplementedError
+        ...
     
     def get_defense(self) -> int:
         """Retourne la défense du personnage"""
-        raise NotImplementedError
+        ...
     
     def get_max_health(self) -> int:
         """Retourne la santé maximale"""
-        raise NotImplementedError
+        ...
 
 
-class BasePlayer(Character):
+class BasePlayer:
     """
     Composant concret de base - Le joueur sans améliorations.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         Logger.log("DECORATOR", "BasePlayer created (no power-ups)")
     
@@ -55,36 +60,99 @@ class BasePlayer(Character):
         return PLAYER_MAX_HEALTH
 
 
-class PowerUpDecorator(Character):
+class PowerUpDecorator:
     """
     Décorateur abstrait pour les power-ups.
     Tous les power-ups concrets héritent de cette classe.
+    
+    Les stats sont composées une seule fois, à la pose du décorateur: la chaîne
+    décorée ne change plus ensuite (un nouveau power-up l'enveloppe), les getters
+    lisent donc un attribut au lieu de parcourir toute la chaîne à chaque appel.
+    Les décorateurs concrets redéfinissent les méthodes _apply_*, pas les getters,
+    et déclarent leurs paramètres avec _set_params et _is_noop.
     """
     
-    def __init__(self, character: Character, powerup_name: str):
+    __slots__ = ("_character", "_speed", "_strength", "_defense", "_max_health")
+    
+    def __new__(cls, character: Character, *args, log: bool = True, **kwargs):
+        """
+        Un décorateur sans effet (voir _is_noop) rend le personnage tel quel,
+        sans ajouter de maillon à la chaîne.
+        """
+        if cls._is_noop(*args, **kwargs):
+            return character
+        return super().__new__(cls)
+    
+    def __init__(self, character: Character, *args, log: bool = True, **kwargs):
         """
         Args:
             character: Le personnage à améliorer
-            powerup_name: Nom du power-up pour le logging
+            *args, **kwargs: Paramètres du décorateur concret (voir _set_params)
+            log: False pour ne pas tracer la pose (apply_stack trace la pile entière)
         """
+        # Si __new__ a rendu un personnage de cette même classe, Python rappelle
+        # __init__ sur lui: il est déjà initialisé, la chaîne ne doit pas changer
+        if character is self:
+            return
+        self._set_params(*args, **kwargs)
         self._character = character
-        Logger.log("DECORATOR", f"{powerup_name} applied to {character.__class__.__name__}")
+        self._refresh()
+        # Message construit seulement si la catégorie DECORATOR est active
+        if log and Logger.enabled_for("DECORATOR"):
+            Logger.log("DECORATOR", f"{self.describe()} applied to {character.__class__.__name__}")
+    
+    @classmethod
+    def _is_noop(cls) -> bool:
+        """Indique si ces paramètres laissent les stats inchangées"""
+        return False
+    
+    def _set_params(self):
+        """Enregistre les paramètres du décorateur concret (aucun par défaut)"""
+        pass
+    
+    def describe(self) -> str:
+        """Nom du power-up et de ses paramètres, pour le logging"""
+        return self.__class__.__name__
+    
+    def _refresh(self):
+        """Recompose les stats à partir du personnage décoré"""
+        character = self._character
+        self._speed = self._apply_speed(character.get_speed())
+        self._strength = self._apply_strength(character.get_strength())
+        self._defense = self._apply_defense(character.get_defense())
+        self._max_health = self._apply_max_health(character.get_max_health())
+    
+    def _apply_speed(self, speed: int) -> int:
+        """Par défaut, garde la vitesse du personnage décoré"""
+        return speed
+    
+    def _apply_strength(self, strength: int) -> int:
+        """Par défaut, garde la force du personnage décoré"""
+        return strength
+    
+    def _apply_defense(self, defense: int) -> int:
+        """Par défaut, garde la défense du personnage décoré"""
+        return defense
+    
+    def _apply_max_health(self, max_health: int) -> int:
+        """Par défaut, garde la santé max du personnage décoré"""
+        return max_health
     
     def get_speed(self) -> int:
-        """Par défaut, retourne la vitesse du personnage décoré"""
-        return self._character.get_speed()
+        """Vitesse composée à la pose du décorateur"""
+        return self._speed
     
     def get_strength(self) -> int:
-        """Par défaut, retourne la force du personnage décoré"""
-        return self._character.get_strength()
+        """Force composée à la pose du décorateur"""
+        return self._strength
     
     def get_defense(self) -> int:
-        """Par défaut, retourne la défense du personnage décoré"""
-        return self._character.get_defense()
+        """Défense composée à la pose du décorateur"""
+        return self._defense
     
     def get_max_health(self) -> int:
-        """Par défaut, retourne la santé max du personnage décoré"""
-        return self._character.get_max_health()
+        """Santé max composée à la pose du décorateur"""
+        return self._max_health
 
 
 class SpeedBoostDecorator(PowerUpDecorator):
@@ -92,18 +160,26 @@ class SpeedBoostDecorator(PowerUpDecorator):
     Power-up: Augmente la vitesse du joueur.
     """
     
-    def __init__(self, character: Character, multiplier: float = 2.0):
+    __slots__ = ("multiplier",)
+    
+    @classmethod
+    def _is_noop(cls, multiplier: float = 2.0) -> bool:
+        return multiplier == 1
+    
+    def _set_params(self, multiplier: float = 2.0):
         """
         Args:
-            character: Personnage à améliorer
             multiplier: Multiplicateur de vitesse (défaut: x2)
         """
-        super().__init__(character, f"SpeedBoostDecorator(x{multiplier})")
         self.multiplier = multiplier
     
-    def get_speed(self) -> int:
+    def describe(self) -> str:
+        """Nom et multiplicateur de vitesse"""
+        return f"SpeedBoostDecorator(x{self.multiplier})"
+    
+    def _apply_speed(self, speed: int) -> int:
         """Multiplie la vitesse"""
-        return int(self._character.get_speed() * self.multiplier)
+        return int(speed * self.multiplier)
 
 
 class StrengthBoostDecorator(PowerUpDecorator):
@@ -111,18 +187,26 @@ class StrengthBoostDecorator(PowerUpDecorator):
     Power-up: Augmente les dégâts du joueur.
     """
     
-    def __init__(self, character: Character, multiplier: float = 2.0):
+    __slots__ = ("multiplier",)
+    
+    @classmethod
+    def _is_noop(cls, multiplier: float = 2.0) -> bool:
+        return multiplier == 1
+    
+    def _set_params(self, multiplier: float = 2.0):
         """
         Args:
-            character: Personnage à améliorer
             multiplier: Multiplicateur de force (défaut: x2)
         """
-        super().__init__(character, f"StrengthBoostDecorator(x{multiplier})")
         self.multiplier = multiplier
     
-    def get_strength(self) -> int:
+    def describe(self) -> str:
+        """Nom et multiplicateur de force"""
+        return f"StrengthBoostDecorator(x{self.multiplier})"
+    
+    def _apply_strength(self, strength: int) -> int:
         """Multiplie la force"""
-        return int(self._character.get_strength() * self.multiplier)
+        return int(strength * self.multiplier)
 
 
 class DefenseBoostDecorator(PowerUpDecorator):
@@ -130,18 +214,26 @@ class DefenseBoostDecorator(PowerUpDecorator):
     Power-up: Augmente la défense du joueur (réduit les dégâts reçus).
     """
     
-    def __init__(self, character: Character, defense_bonus: int = 2):
+    __slots__ = ("defense_bonus",)
+    
+    @classmethod
+    def _is_noop(cls, defense_bonus: int = 2) -> bool:
+        return defense_bonus == 0
+    
+    def _set_params(self, defense_bonus: int = 2):
         """
         Args:
-            character: Personnage à améliorer
             defense_bonus: Points de défense à ajouter
         """
-        super().__init__(character, f"DefenseBoostDecorator(+{defense_bonus})")
         self.defense_bonus = defense_bonus
     
-    def get_defense(self) -> int:
+    def describe(self) -> str:
+        """Nom et bonus de défense"""
+        return f"DefenseBoostDecorator(+{self.defense_bonus})"
+    
+    def _apply_defense(self, defense: int) -> int:
         """Ajoute de la défense"""
-        return self._character.get_defense() + self.defense_bonus
+        return defense + self.defense_bonus
 
 
 class HealthBoostDecorator(PowerUpDecorator):
@@ -149,18 +241,26 @@ class HealthBoostDecorator(PowerUpDecorator):
     Power-up: Augmente la santé maximale du joueur.
     """
     
-    def __init__(self, character: Character, health_bonus: int = 10):
+    __slots__ = ("health_bonus",)
+    
+    @classmethod
+    def _is_noop(cls, health_bonus: int = 10) -> bool:
+        return health_bonus == 0
+    
+    def _set_params(self, health_bonus: int = 10):
         """
         Args:
-            character: Personnage à améliorer
             health_bonus: Points de santé max à ajouter
         """
-        super().__init__(character, f"HealthBoostDecorator(+{health_bonus})")
         self.health_bonus = health_bonus
     
-    def get_max_health(self) -> int:
+    def describe(self) -> str:
+        """Nom et bonus de santé"""
+        return f"HealthBoostDecorator(+{self.health_bonus})"
+    
+    def _apply_max_health(self, max_health: int) -> int:
         """Augmente la santé maximale"""
-        return self._character.get_max_health() + self.health_bonus
+        return max_health + self.health_bonus
 
 
 class MultiShotDecorator(PowerUpDecorator):
@@ -170,12 +270,36 @@ class MultiShotDecorator(PowerUpDecorator):
     Pour l'instant, elle augmente juste la force.
     """
     
-    def __init__(self, character: Character):
-        super().__init__(character, "MultiShotDecorator")
+    __slots__ = ()
     
-    def get_strength(self) -> int:
+    def _apply_strength(self, strength: int) -> int:
         """Augmente significativement la force (simule plusieurs tirs)"""
-        return self._character.get_strength() + 2
+        return strength + 2
+
+
+def apply_stack(character: Character, stack) -> Character:
+    """
+    Applique plusieurs power-ups d'un coup (objet combo), avec une seule trace
+    pour toute la pile au lieu d'un message par décorateur.
+    
+    Args:
+        character: Personnage à améliorer
+        stack: Liste de (classe de décorateur, paramètres), ex:
+               [(SpeedBoostDecorator, {"multiplier": 2.0}), (MultiShotDecorator, {})]
+    
+    Returns:
+        Character: Le personnage décoré
+    """
+    applied = []
+    for decorator_class, params in stack:
+        decorated = decorator_class(character, log=False, **params)
+        # Les décorateurs sans effet rendent le personnage tel quel
+        if decorated is not character:
+            applied.append(decorated)
+        character = decorated
+    if applied and Logger.enabled_for("DECORATOR"):
+        Logger.log("DECORATOR", f"Stack [{', '.join(d.describe() for d in applied)}] applied")
+    return character
 
 
 # Test du pattern Decorator
@@ -8,6 +8,13 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Pygame importé et initialisé une seule fois pour tous les tests: seul
+# l'affichage est utile (surfaces), sans fenêtre ni son en CI
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import pygame
+pygame.display.init()
+
 def test_singleton():
     """Test Singleton Pattern"""
     from game_manager import GameManager
@@ -22,14 +29,16 @@ def test_singleton():
 def test_observer():
     """Test Observer Pattern"""
     from events.event_system import EventManager, Observer
-    from config import EVENT_ENEMY_DEFEATED
+    from config import EVENT_ENEMY_DEFEATED, EVENT_ITEM_COLLECTED
     
     class TestObserver(Observer):
         def __init__(self):
             self.notified = False
+            self.received = []
         
         def notify(self, event_type, data=None):
             self.notified = True
+            self.received.append((event_type, data))
     
     em = EventManager()
     obs = TestObserver()
@@ -37,15 +46,36 @@ def test_observer():
     em.notify_observers(EVENT_ENEMY_DEFEATED)
     
     assert obs.notified, "Observer not notified"
+    
+    # File d'événements: rien avant flush(), puis livraison dans l'ordre des post()
+    em.subscribe(EVENT_ITEM_COLLECTED, obs)
+    obs.received.clear()
+    em.post(EVENT_ITEM_COLLECTED, {"n": 1})
+    em.post(EVENT_ENEMY_DEFEATED, {"n": 2})
+    assert obs.received == [], "post() notified before flush()"
+    em.flush()
+    assert obs.received == [(EVENT_ITEM_COLLECTED, {"n": 1}), (EVENT_ENEMY_DEFEATED, {"n": 2})], \
+        "flush() didn't deliver events in posting order"
+    
+    # clear() oublie aussi les événements postés mais pas encore notifiés (reset_game)
+    em.post(EVENT_ENEMY_DEFEATED)
+    em.clear()
+    em.subscribe(EVENT_ENEMY_DEFEATED, obs)
+    obs.received.clear()
+    em.flush()
+    assert obs.received == [], "clear() kept pending events"
+    em.clear()
+    
+    obs.notified = False
+    em.clear()
+    em.notify_observers(EVENT_ENEMY_DEFEATED)
+    assert not obs.notified, "Observer still notified after clear()"
     print("✅ Observer Pattern: PASSED")
     return True
 
 def test_factory():
     """Test Factory Pattern"""
-    import pygame
-    pygame.init()
-    
-    from entities import EnemyFactory, load_enemy_images
+    from entities import EnemyFactory, ItemFactory, load_enemy_images, load_item_images
     
     images = load_enemy_images()
     factory = EnemyFactory(images)
@@ -55,12 +85,24 @@ def test_factory():
     
     assert metall is not None, "Factory failed to create Metall"
     assert blader is not None, "Factory failed to create Blader"
+    
+    # Chaque type d'objet crée bien un objet de ce type
+    item_factory = ItemFactory(load_item_images())
+    for item_type in ("life_energy", "big_life_energy", "score_ball", "strength_up"):
+        item = item_factory.create(item_type, 0, 0)
+        assert item is not None and item.item_type == item_type, f"ItemFactory created wrong item for {item_type}"
+    
+    # Un objet rendu à la factory est recyclé, remis à neuf
+    item.used = True
+    item_factory.release(item)
+    recycled = item_factory.create(item.item_type, 10, 20)
+    assert recycled is item and not recycled.used, "Released item not recycled by create()"
     print("✅ Factory Pattern: PASSED")
     return True
 
 def test_decorator():
     """Test Decorator Pattern"""
-    from powerups import BasePlayer, SpeedBoostDecorator, StrengthBoostDecorator
+    from powerups import BasePlayer, SpeedBoostDecorator, StrengthBoostDecorator, MultiShotDecorator, apply_stack
     
     player = BasePlayer()
     base_speed = player.get_speed()
@@ -69,14 +111,22 @@ def test_decorator():
     boosted_speed = player.get_speed()
     
     assert boosted_speed == base_speed * 2, "Decorator didn't boost speed"
+    # Décorateur sans effet sur un décorateur de même classe: chaîne intacte
+    inner = player._character
+    assert SpeedBoostDecorator(player, 1.0) is player, "Identity decorator should not wrap"
+    assert player._character is inner, "Identity decorator rewired the chain"
+    assert player.multiplier == 2.0 and player.get_speed() == base_speed * 2, "Identity decorator reset the multiplier"
+    # ... et sur un personnage d'une autre classe
+    base = BasePlayer()
+    assert StrengthBoostDecorator(base, 1.0) is base, "Identity decorator should not wrap"
+    
+    combo = apply_stack(BasePlayer(), [(SpeedBoostDecorator, {"multiplier": 2.0}), (MultiShotDecorator, {})])
+    assert combo.get_speed() == base_speed * 2 and combo.get_strength() == 3, "apply_stack didn't stack power-ups"
     print("✅ Decorator Pattern: PASSED")
     return True
 
 def test_composite():
     """Test Composite Pattern"""
-    import pygame
-    pygame.init()
-    
     from levels.level_components import Level, Zone, Tile
     
     level = Level(1)
@@ -88,14 +138,24 @@ def test_composite():
     
     assert len(level.get_children()) == 1, "Composite failed to add zone"
     assert len(level.get_all_solid_tiles()) == 1, "Composite failed to retrieve tiles"
+    assert level.tiles_near(pygame.Rect(10, 10, 4, 4)) == [tile], "Spatial grid missed the tile"
+    assert level.tiles_near(pygame.Rect(40, 10, 4, 4)) == [], "Spatial grid returned a distant tile"
+    
+    solid_tiles = level.get_all_solid_tiles()
+    assert level.get_all_solid_tiles() is solid_tiles, "Solid tiles not cached between frames"
+    zone.add(Tile(32, 0, pygame.Surface((32, 32))))
+    assert len(level.get_all_solid_tiles()) == 2, "Solid tile cache not invalidated on add"
+    
+    # Tuile non alignée sur la grille: trouvée depuis chaque case qu'elle couvre, une seule fois
+    offset = Tile(80, 16, pygame.Surface((32, 32)))
+    zone.add(offset)
+    assert level.tiles_near(pygame.Rect(100, 40, 4, 4)) == [offset], "Spatial grid missed a non-aligned tile"
+    assert level.tiles_near(pygame.Rect(70, 10, 60, 50)) == [offset], "Spatial grid duplicated a spanning tile"
     print("✅ Composite Pattern: PASSED")
     return True
 
 def test_state():
     """Test State Pattern"""
-    import pygame
-    pygame.init()
-    
     from player.player_states import IdleState, JumpingState
     
     idle = IdleState()
@@ -103,6 +163,15 @@ def test_state():
     
     assert idle is not None, "IdleState creation failed"
     assert jumping is not None, "JumpingState creation failed"
+    
+    # Atterrissage sans direction pressée: retour à Idle
+    from player import Player, load_player_images
+    from player.player_states import IDLE, JUMPING
+    player = Player(0, 0, load_player_images())
+    player.set_state(JUMPING)
+    player.jumping = False
+    player.update()
+    assert player.state is IDLE, "Landing without input should go back to Idle"
     print("✅ State Pattern: PASSED")
     return True
 